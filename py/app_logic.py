@@ -8,14 +8,16 @@ Handles configuration updates, code compilation with ESP-IDF, and firmware uploa
 Manages the complete workflow from Kconfig parsing to ESP32 flashing.
 '''
 
-import glob
-import re
+import asyncio
+import functools
+import hashlib
+import logging
 from typing import List, Optional, Type, Any, Tuple
 import traceback
 import os
 import shutil
-import time
-import multiprocessing
+import subprocess
+import threading
 import psutil
 
 from py.shell_commands import ShellCommandConfig, ShellCommandProcess
@@ -28,6 +30,43 @@ reconfig_logger = RichLogHandler.get_logger(LogSource.RECONFIG)
 build_logger = RichLogHandler.get_logger(LogSource.BUILD)
 flash_logger = RichLogHandler.get_logger(LogSource.FLASH)
 
+# Parsed Kconfig trees shared across re_init calls (and GUI instances),
+# keyed by (path, mtime_ns, menu_name) so a changed file re-parses
+_KCONFIG_CACHE: dict = {}
+_KCONFIG_CACHE_LOCK = threading.Lock()
+
+
+def _load_kconfig_cached(kconfig_path: str, menu_name: str,
+                         only_menus: frozenset = None) -> KconfigMenuItems:
+    """
+    Load Kconfig menu items, reusing the parsed tree while the file is unchanged.
+    Parsing the Kconfig tree is the expensive part of re_init; an os.stat
+    per call replaces a full re-parse when nothing changed.
+
+    Args:
+        kconfig_path: Path to Kconfig.projbuild file
+        menu_name: Parent menu name to search for
+        only_menus: Optional menu prompts to extract eagerly (see KconfigMenuItems)
+
+    Returns:
+        KconfigMenuItems instance (shared while the file is unchanged)
+    """
+    try:
+        mtime_ns = os.stat(kconfig_path).st_mtime_ns
+    except OSError:
+        return KconfigMenuItems(kconfig_path, menu_name, only_menus=only_menus)
+
+    key = (kconfig_path, mtime_ns, menu_name)
+    with _KCONFIG_CACHE_LOCK:
+        items = _KCONFIG_CACHE.get(key)
+        if items is None:
+            items = KconfigMenuItems(kconfig_path, menu_name, only_menus=only_menus)
+            # Drop stale parses of the same file so the cache stays small
+            for stale_key in [k for k in _KCONFIG_CACHE if k[0] == kconfig_path and k[2] == menu_name]:
+                del _KCONFIG_CACHE[stale_key]
+            _KCONFIG_CACHE[key] = items
+        return items
+
 
 class FlashApp:
     """
@@ -36,6 +75,12 @@ class FlashApp:
     """
 
     WORKSPACES_DIR = ".workspaces"
+    LIB_MENU = "Select CAN driver/library"
+    EXAMPLE_MENU = "Select example"
+    CRITICAL_HASH_FILE = ".critical_hash"
+    BUILD_FINGERPRINT_FILE = ".build_fingerprint"
+    # Non-CAN keys whose change invalidates incremental build artifacts
+    CRITICAL_CONFIG_KEYS = ("CONFIG_IDF_TARGET", "CONFIG_COMPILER_OPTIMIZATION")
 
     def __init__(
             self,
@@ -69,24 +114,67 @@ class FlashApp:
         self.compilation_process = None
         self.compilation_lib_id = None
         self.compilation_example_id = None
+        # (sdkconfig instance, lib_id, example_id) of the last applied update;
+        # lets _update_sdkconfig touch only the changed lines next time
+        self._last_selection = None
+        # workspace dir -> (sdkconfig file mtime_ns, Sdkconfig); reusing the
+        # parsed instance across switches is what keeps _last_selection's
+        # identity check - and with it the fast path - alive
+        self._workspace_sdkconfigs = {}
+
+        self._ports_scan_result = None
+        self._ports_scan_mtime = None
+        self.real_ports_found = False
+
+        self._idf_env = None
+        self._idf_env_mtime = 0
 
         self.re_init()
         self._workspace_path = sdkconfig_path
 
     def re_init(self):
         """Reload configuration from Kconfig and sdkconfig files."""
-        self.kconfig_dict = KconfigMenuItems(self.kconfig_path, self.menu_name)
+        # The GUI only needs the two choice menus; extracting anything else
+        # is deferred until a build path asks for get_all_options()/all_ids
+        self.kconfig_dict = _load_kconfig_cached(
+            self.kconfig_path, self.menu_name,
+            only_menus=frozenset((self.LIB_MENU, self.EXAMPLE_MENU)))
+        self._lib_menu = self.kconfig_dict._menus_dict.get(self.LIB_MENU, {})
+        self._example_menu = self.kconfig_dict._menus_dict.get(self.EXAMPLE_MENU, {})
         self.sdkconfig = Sdkconfig(self.sdkconfig_path, self.menu_name)
-        self.sdkconfig.add_no_existing_bool_keys(self.kconfig_dict.get_all_options().keys())
+        self.sdkconfig.add_no_existing_bool_keys([*self._lib_menu, *self._example_menu])
         self.lib_options, self.example_options = self.load_kconfig_options()
+        # Column-wise views of the option tables for hot paths that only
+        # need ids or display names (e.g. building Select choices)
+        self.lib_ids = [opt.id for opt in self.lib_options]
+        self.lib_display_names = [opt.display_name for opt in self.lib_options]
+        self.example_ids = [opt.id for opt in self.example_options]
+        self.example_display_names = [opt.display_name for opt in self.example_options]
+        # Ready-made (label, value) choice tuples for Select widgets; built
+        # once here instead of once per port row at compose time
+        self.lib_choices = tuple(zip(self.lib_display_names, self.lib_ids))
+        self.example_choices = tuple(zip(self.example_display_names, self.example_ids))
+        # All lib/example compatibility answers, precomputed so
+        # check_dependencies is one dict lookup per GUI selection change
+        self._compat = {
+            (lib.id, example.id): example.depends_on is None or lib.id in example.depends_on
+            for lib in self.lib_options
+            for example in self.example_options
+        }
 
     def get_lib_option_by_id(self, lib_id: str) -> Optional[ConfigOption]:
         """Find library option by ID."""
-        return self.kconfig_dict.get_option_by_id("Select CAN driver/library", lib_id)
+        option = self._lib_menu.get(lib_id)
+        if option is None:
+            config_logger.warning(f"Option {lib_id} not found in menu '{self.LIB_MENU}'")
+        return option
 
     def get_example_option_by_id(self, example_id: str) -> Optional[ConfigOption]:
         """Find example option by ID."""
-        return self.kconfig_dict.get_option_by_id("Select example", example_id)
+        option = self._example_menu.get(example_id)
+        if option is None:
+            config_logger.warning(f"Option {example_id} not found in menu '{self.EXAMPLE_MENU}'")
+        return option
 
     def check_dependencies(self, lib_id: str, example_id: str, prompt_char: str = '✏️') -> bool:
         """
@@ -103,30 +191,16 @@ class FlashApp:
         if not lib_id or not example_id:
             return False
 
-        lib_option = self.get_lib_option_by_id(lib_id)
-        example_option = self.get_example_option_by_id(example_id)
-
-        config_logger.debug(f"{prompt_char} lib_id='{lib_id}', lib_option={lib_option}")
-        config_logger.debug(f"{prompt_char} example_id='{example_id}', example_option={example_option}")
-
-        if not lib_option or not example_option:
-            config_logger.debug(f"{prompt_char} One or both options not found")
-            return False
-        if not example_option.depends_on:
-            config_logger.debug(f"{prompt_char} No dependencies required - compatible")
-            return True
-        if lib_option.id in example_option.depends_on:
-            config_logger.debug(
-                f"{prompt_char} {lib_option.id} found in dependencies "
-                f"{example_option.depends_on} -> OK"
-            )
-            return True
-        else:
-            config_logger.debug(
-                f"{prompt_char} {lib_option.id} NOT found in dependencies "
-                f"{example_option.depends_on} -> FAIL"
-            )
+        compatible = self._compat.get((lib_id, example_id))
+        if compatible is None:
+            if config_logger.isEnabledFor(logging.DEBUG):
+                config_logger.debug(f"{prompt_char} Unknown lib/example combination "
+                                    f"'{lib_id}'/'{example_id}' - one or both options not found")
             return False
+        if config_logger.isEnabledFor(logging.DEBUG):
+            config_logger.debug(f"{prompt_char} '{lib_id}' + '{example_id}' -> "
+                                f"{'OK' if compatible else 'FAIL'}")
+        return compatible
 
     def _switch_to_workspace(self, lib_id: str, example_id: str):
         """
@@ -141,25 +215,46 @@ class FlashApp:
         Returns:
             True on success
         """
-        def create_symbolic_link(old_path: str, link_path: str):            
-            if not os.path.islink(link_path):
-                reconfig_logger.info(f"Create symbolic link from \n{link_path} \nto \n{old_path}")
-                os.symlink(old_path, link_path)
         reconfig_logger.info(f"Switching to workspace for lib='{lib_id}' and example='{example_id}'")
         workspace_dir = os.path.join(self.WORKSPACES_DIR, f"{lib_id}_{example_id}")
         workspace_dir = os.path.realpath(os.path.expanduser(workspace_dir))
-        if not os.path.exists(workspace_dir):
-            os.makedirs(workspace_dir)
-        link_list = [x for x in os.listdir(".") if os.path.isdir(x) and x != 'build' and (not x.startswith('.'))]
+        os.makedirs(workspace_dir, exist_ok=True)
+        cwd = os.getcwd()
+        with os.scandir(cwd) as entries:
+            link_list = [
+                entry.name for entry in entries
+                if entry.is_dir() and entry.name != 'build' and not entry.name.startswith('.')
+            ]
         link_list.append("CMakeLists.txt")
+        # One scan of the workspace replaces a per-item existence check, so a
+        # repeat switch issues no symlink syscalls at all
+        with os.scandir(workspace_dir) as entries:
+            existing = {entry.name for entry in entries}
         for item in link_list:
-            abs_old_path = os.path.abspath(f"./{item}")
-            abs_link_path = os.path.abspath(f"{workspace_dir}/{item}")
-            create_symbolic_link(abs_old_path, abs_link_path)
-        if not os.path.exists(f"{workspace_dir}/sdkconfig"):
-            shutil.copy(self.sdkconfig_path, f"{workspace_dir}/sdkconfig")
-        # Always reload sdkconfig from workspace path to operate on the correct file
-        self.sdkconfig = Sdkconfig(f"{workspace_dir}/sdkconfig", self.menu_name)
+            if item in existing:
+                continue
+            old_path = os.path.join(cwd, item)
+            try:
+                os.symlink(old_path, os.path.join(workspace_dir, item))
+                reconfig_logger.info(f"Create symbolic link from \n{workspace_dir}/{item} \nto \n{old_path}")
+            except FileExistsError:
+                pass
+        sdkconfig_file = os.path.join(workspace_dir, 'sdkconfig')
+        if 'sdkconfig' not in existing:
+            shutil.copy(self.sdkconfig_path, sdkconfig_file)
+        # Reuse the parsed Sdkconfig while the file on disk is untouched;
+        # idf.py may rewrite sdkconfig during a build, hence the mtime
+        # check before trusting the cache
+        try:
+            mtime = os.stat(sdkconfig_file).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached = self._workspace_sdkconfigs.get(workspace_dir)
+        if cached is not None and mtime is not None and cached[0] == mtime:
+            self.sdkconfig = cached[1]
+        else:
+            self.sdkconfig = Sdkconfig(sdkconfig_file, self.menu_name)
+            self._workspace_sdkconfigs[workspace_dir] = (mtime, self.sdkconfig)
         self._workspace_path = workspace_dir
         reconfig_logger.info(f"Switched to workspace: {workspace_dir}")
         return True
@@ -178,39 +273,36 @@ class FlashApp:
         """
         try:
             reconfig_logger.info(f"Consider to update sdkconfig for lib='{lib_id}' and example='{example_id}'")
-            all_options = self.kconfig_dict.get_all_options()
-            config_ids = list(all_options.keys())
-            reconfig_logger.debug(f"Found {len(config_ids)} config options: {config_ids}")
-            # Ensure selected keys exist in sdkconfig so they can be set correctly
-            self.sdkconfig.add_no_existing_bool_keys([lib_id, example_id])
-            relevant_lines = {}
-            for config_id in config_ids:
-                line = self.sdkconfig.get_line_by_key(config_id)
-                if line:
-                    relevant_lines[config_id] = line
-                    config_logger.debug(f"Found existing line for {config_id}: {line.value}")
-                else:
-                    config_logger.debug(f"Config {config_id} not found in sdkconfig")
-            changes_made = 0
-            for config_id, line in relevant_lines.items():
-                if config_id == lib_id:
-                    new_value = 'y'
-                    reconfig_logger.info(f"ENABLE: {config_id} (selected lib)")
-                elif config_id == example_id:
-                    new_value = 'y'
-                    reconfig_logger.info(f"ENABLE: {config_id} (selected example)")
-                else:
-                    new_value = 'n'
-                    reconfig_logger.debug(f"DISABLE: {config_id} (not selected)")
-                reconfig_logger.info(f"Consider to change {config_id}: '{line.value}' -> '{new_value}'")
-                if line.value != new_value:
-                    line.set_value(new_value)
-                    changes_made += 1
-                    reconfig_logger.debug(f"Changed {config_id}: {line.value} -> {new_value}")
+            if self._last_selection is not None and self._last_selection[0] is self.sdkconfig:
+                # Steady state: only the previously and newly selected options
+                # can differ, so at most four lines need to be touched
+                _, last_lib_id, last_example_id = self._last_selection
+                relevant_lines, missing_keys = self.sdkconfig.get_lines_by_keys(
+                    {last_lib_id, last_example_id, lib_id, example_id})
+            else:
+                all_options = self.kconfig_dict.get_all_options()
+                config_ids = list(all_options.keys())
+                reconfig_logger.debug(f"Found {len(config_ids)} config options: {config_ids}")
+                # Ensure selected keys exist in sdkconfig so they can be set correctly
+                self.sdkconfig.add_no_existing_bool_keys([lib_id, example_id])
+                relevant_lines, missing_keys = self.sdkconfig.get_lines_by_keys(config_ids)
+            if missing_keys:
+                config_logger.debug(f"Configs not found in sdkconfig: {missing_keys}")
+            desired = {lib_id: 'y', example_id: 'y'}
+            targets = {config_id: desired.get(config_id, 'n') for config_id in relevant_lines}
+            changes_made = self.sdkconfig.apply_values(targets)
+            self._last_selection = (self.sdkconfig, lib_id, example_id)
             if changes_made > 0:
                 reconfig_logger.info(f"Writing sdkconfig with {changes_made} changes")
                 self.sdkconfig.set_sdkconfig_path(f'{self._workspace_path}/sdkconfig')
-                self.sdkconfig.write()                
+                self.sdkconfig.write()
+                # Our own write moved the file mtime; keep the workspace
+                # cache entry valid so the next switch reuses this instance
+                try:
+                    mtime = os.stat(f'{self._workspace_path}/sdkconfig').st_mtime_ns
+                    self._workspace_sdkconfigs[self._workspace_path] = (mtime, self.sdkconfig)
+                except OSError:
+                    self._workspace_sdkconfigs.pop(self._workspace_path, None)
             else:
                 reconfig_logger.info("No changes needed in sdkconfig")
 
@@ -237,51 +329,38 @@ class FlashApp:
             
         Returns:
             True on success, False on failure
-        """ 
-        def log_start():
-            logger.info(f"--- {name} starts 🚀 ---\n") 
-        
-        def log_success(success: bool):
-            if success:
-                logger.info(f"=== {name} completed ✅ ===") 
-            else:
-                logger.error(f"!!! {name} failed ❌ !!!") 
-
+        """
         try:
             if isinstance(target, ShellCommandConfig):
                 process = ShellCommandProcess(config=target, logger=logger)
-                log_start()
+                logger.info(f"--- {name} starts 🚀 ---\n")
                 success = await process.run_end_wait()
-                log_success(success)
-                return success
             elif callable(target):
                 result = target(*args, **kwargs)
-                if isinstance(result, bool):
-                    log_success(result)
-                    return result
-                else:
-                    log_success(True)
-                return True
+                success = result if isinstance(result, bool) else True
             else:
                 raise TypeError("First argument must be ShellCommandConfig or a function.")
+            if success:
+                logger.info(f"=== {name} completed ✅ ===")
+            else:
+                logger.error(f"!!! {name} failed ❌ !!!")
+            return success
         except Exception as e:
             logger.error(f"!!! {name} failed ❌: {e} !!!")
             logger.info(traceback.format_exc())
             return False
 
-    async def config_compile_flash(self, port: str, lib_id: str, example_id: str) -> bool:
+    async def _configure_and_build(self, lib_id: str, example_id: str) -> bool:
         """
-        Execute complete build and flash workflow.
+        Prepare workspace and compile firmware for one lib/example combination.
         1. Switch to workspace
         2. Update sdkconfig
         3. Compile firmware
-        4. Flash to device
-        
+
         Args:
-            port: Serial port identifier
             lib_id: Library configuration ID
             example_id: Example configuration ID
-            
+
         Returns:
             True if all steps successful, False if any step fails
         """
@@ -294,75 +373,176 @@ class FlashApp:
         if not success0:
             return False
         success1 = await self.call_with_results(
-            target=self._update_sdkconfig, 
-            name="Update sdkconfig", 
-            logger=reconfig_logger, 
+            target=self._update_sdkconfig,
+            name="Update sdkconfig",
+            logger=reconfig_logger,
             lib_id=lib_id, example_id=example_id
         )
         if not success1:
             return False
+        if self._build_is_current():
+            build_logger.info("Sources and sdkconfig unchanged since last build - skipping compilation")
+            return True
         jobs = self.get_optimal_jobs()
-        should_fullclean = self.should_fullclean(None, None)
-        if should_fullclean:
-            command = (
-                f"bash -c 'export MAKEFLAGS=-j{jobs} && "
-                f"source {self.idf_setup_path} && "
-                f"cd {self._workspace_path} && "
-                f"idf.py fullclean && idf.py build'"
+        should_fullclean = self.should_fullclean()
+        build_command = "idf.py fullclean && idf.py build" if should_fullclean else "idf.py build"
+        idf_env = await asyncio.to_thread(self._get_idf_env)
+        if idf_env is not None:
+            target = ShellCommandConfig(
+                name="Compile ESP32 firmware",
+                command=build_command,
+                env=dict(idf_env, MAKEFLAGS=f"-j{jobs}"),
+                cwd=self._workspace_path,
             )
         else:
-            command = (
-                f"bash -c 'export MAKEFLAGS=-j{jobs} && "
-                f"source {self.idf_setup_path} && "
-                f"cd {self._workspace_path} && "
-                f"idf.py build'"
+            # Fall back to sourcing the setup script inside the shell
+            target = ShellCommandConfig(
+                name="Compile ESP32 firmware",
+                command=(
+                    f"bash -c 'export MAKEFLAGS=-j{jobs} && "
+                    f"source {self.idf_setup_path} && "
+                    f"cd {self._workspace_path} && "
+                    f"{build_command}'"
+                ),
             )
         success2 = await self.call_with_results(
             name="Compile ESP32 firmware",
-            target=ShellCommandConfig(
-                name="Compile ESP32 firmware",  
-                command=command
-            ), 
-            logger=build_logger, 
+            target=target,
+            logger=build_logger,
         )
-        if not success2:
-            return False
+        if success2:
+            self._record_critical_hash()
+            self._record_build_fingerprint()
+        return success2
+
+    async def _flash_port(self, port: str, workspace_path: str) -> bool:
+        """
+        Flash previously built firmware from a workspace to one port.
+
+        Args:
+            port: Serial port identifier
+            workspace_path: Workspace containing the built firmware
 
-        time.sleep(0.5)
-        command = f"bash -c 'source {self.idf_setup_path} && cd {self._workspace_path} && idf.py -p /dev/{port} flash'"
-        success3 = await self.call_with_results(
+        Returns:
+            True if flashing succeeded
+        """
+        idf_env = await asyncio.to_thread(self._get_idf_env)
+        if idf_env is not None:
+            target = ShellCommandConfig(
+                name=f"Flash firmware to /dev/{port}",
+                command=['idf.py', '-p', f'/dev/{port}', 'flash'],
+                env=idf_env,
+                cwd=workspace_path,
+            )
+        else:
+            target = ShellCommandConfig(
+                name=f"Flash firmware to /dev/{port}",
+                command=f"bash -c 'source {self.idf_setup_path} && cd {workspace_path} && idf.py -p /dev/{port} flash'",
+            )
+        return await self.call_with_results(
             name=f"Flash firmware to /dev/{port}",
-            target=ShellCommandConfig(
-                name=f"Flash firmware to /dev/{port}", 
-                command=command
-            ), 
-            logger=flash_logger, 
+            target=target,
+            logger=flash_logger,
         )
-        return success3
 
-    def find_flash_ports(self, default_ports: List[str] = None) -> Tuple[List[str], bool]:
+    async def config_compile_flash(self, port: str, lib_id: str, example_id: str) -> bool:
+        """
+        Execute complete build and flash workflow.
+        1. Switch to workspace
+        2. Update sdkconfig
+        3. Compile firmware
+        4. Flash to device
+
+        Args:
+            port: Serial port identifier
+            lib_id: Library configuration ID
+            example_id: Example configuration ID
+
+        Returns:
+            True if all steps successful, False if any step fails
+        """
+        if not await self._configure_and_build(lib_id, example_id):
+            return False
+        await asyncio.sleep(0.5)
+        return await self._flash_port(port, self._workspace_path)
+
+    async def config_compile_many(self, requests: List[Tuple[str, str, str]]) -> bool:
+        """
+        Build and flash many (port, lib_id, example_id) requests.
+        Requests are grouped by lib/example combination so each distinct
+        firmware is compiled exactly once; builds precede their flashes and
+        the flashes of one group run one after another.
+
+        Args:
+            requests: List of (port, lib_id, example_id) tuples
+
+        Returns:
+            True if every build and flash succeeded
+        """
+        ports_by_build: dict[Tuple[str, str], List[str]] = {}
+        for port, lib_id, example_id in requests:
+            ports_by_build.setdefault((lib_id, example_id), []).append(port)
+
+        all_ok = True
+        for (lib_id, example_id), ports in ports_by_build.items():
+            if len(ports) > 1:
+                build_logger.info(
+                    f"Building {lib_id}/{example_id} once for ports: {', '.join(ports)}")
+            if not await self._configure_and_build(lib_id, example_id):
+                all_ok = False
+                continue
+            await asyncio.sleep(0.5)
+            workspace_path = self._workspace_path
+            # idf.py flash re-enters the shared build directory for its
+            # CMake/ninja check step, and concurrent ninja runs in one
+            # build dir race, so the group's ports flash sequentially
+            for port in ports:
+                all_ok = await self._flash_port(port, workspace_path) and all_ok
+        return all_ok
+
+    def find_flash_ports(self, default_ports: List[str] = None) -> List[str]:
         """
         Detect available ESP32 serial ports.
-        
+        Sets self.real_ports_found to indicate whether the returned ports
+        are real devices or the fake defaults.
+
         Args:
             default_ports: Fake ports to use if no real ports found
-            
+
         Returns:
-            Tuple of (port_list, real_ports_found_flag)
+            List of port names
         """
         if default_ports is None:
             default_ports = ['Port1', 'Port2', 'Port3', 'Port4']
-        real_ports_found = False
-        ports = glob.glob('/dev/ttyACM*')
-        flash_ports1 = sorted(p[5:] for p in ports if re.match(r'/dev/ttyACM\d+$', p))
-        ports = glob.glob('/dev/ttyUSB*')
-        flash_ports2 = sorted(p[5:] for p in ports if re.match(r'/dev/ttyUSB\d+$', p))
-        flash_ports = flash_ports1 + flash_ports2
-        if not flash_ports:
-            return default_ports, real_ports_found
+        # /dev (devtmpfs) mtime changes whenever a device node is added or
+        # removed, so an unchanged mtime means the cached scan is still valid
+        try:
+            dev_mtime = os.stat('/dev').st_mtime_ns
+        except OSError:
+            dev_mtime = None
+        if self._ports_scan_result is not None and dev_mtime is not None \
+                and dev_mtime == self._ports_scan_mtime:
+            flash_ports = self._ports_scan_result
         else:
-            real_ports_found = True
-            return flash_ports, real_ports_found
+            flash_ports1 = []
+            flash_ports2 = []
+            try:
+                with os.scandir('/dev') as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith('ttyACM') and name[6:].isdigit():
+                            flash_ports1.append(name)
+                        elif name.startswith('ttyUSB') and name[6:].isdigit():
+                            flash_ports2.append(name)
+            except OSError:
+                pass
+            flash_ports = sorted(flash_ports1) + sorted(flash_ports2)
+            self._ports_scan_result = flash_ports
+            self._ports_scan_mtime = dev_mtime
+        self.real_ports_found = bool(flash_ports)
+        if not flash_ports:
+            return default_ports
+        return flash_ports
 
     def load_kconfig_options(self) -> tuple[List[ConfigOption], List[ConfigOption]]:
         """
@@ -371,39 +551,26 @@ class FlashApp:
         Returns:
             Tuple of (lib_options, example_options)
         """
-        lib_menu = "Select CAN driver/library"
-        lib_options = []
-        if lib_menu in self.kconfig_dict._menus_dict:
-            for option in self.kconfig_dict._menus_dict[lib_menu].values():
-                lib_options.append(ConfigOption(
-                    id=option.id,
-                    display_name=option.display_name,
-                    config_type=option.config_type,
-                    depends_on=option.depends_on
-                ))  
-        example_menu = "Select example"
-        example_options = []
-        if example_menu in self.kconfig_dict._menus_dict:
-            for option in self.kconfig_dict._menus_dict[example_menu].values():
-                example_options.append(ConfigOption(
-                    id=option.id,
-                    display_name=option.display_name,
-                    config_type=option.config_type,
-                    depends_on=option.depends_on
-                ))
-
-        return lib_options, example_options 
+        # The menus already hold ConfigOption instances; a shallow list copy
+        # keeps callers free to reorder without rebuilding every option.
+        lib_options = list(self._lib_menu.values())
+        example_options = list(self._example_menu.values())
+        return lib_options, example_options
 
     @staticmethod
+    @functools.cache
     def get_optimal_jobs() -> int:
         """
         Calculate optimal number of parallel compilation jobs.
-        Based on CPU count and available memory.
-        
+        Based on CPU count and available memory; computed once and cached,
+        so repeated builds skip re-reading /proc/meminfo.
+
         Returns:
             Number of parallel jobs (1-16)
         """
-        cpu_count = multiprocessing.cpu_count()
+        # sched_getaffinity honours cgroup/container CPU limits,
+        # unlike multiprocessing.cpu_count()
+        cpu_count = len(os.sched_getaffinity(0))
         available_memory = psutil.virtual_memory().available / (1024**3)
         if available_memory < 4:
             jobs = max(1, cpu_count - 2)
@@ -416,16 +583,159 @@ class FlashApp:
         
         return jobs
 
-    def should_fullclean(self, old_config: dict = None, new_config: dict = None) -> bool:
+    def _get_idf_env(self) -> Optional[dict]:
+        """
+        Source the ESP-IDF setup script once and cache the environment.
+        The cache is invalidated when the setup script's mtime changes, so
+        build and flash subprocesses skip re-sourcing it on every call.
+
+        Returns:
+            Environment dict for idf.py subprocesses, or None if sourcing failed
+        """
+        setup_path = os.path.expanduser(self.idf_setup_path)
+        try:
+            mtime_ns = os.stat(setup_path).st_mtime_ns
+        except OSError:
+            return None
+        if self._idf_env is not None and self._idf_env_mtime == mtime_ns:
+            return self._idf_env
+
+        try:
+            result = subprocess.run(
+                ['bash', '-c', f'source {setup_path} >/dev/null 2>&1 && env -0'],
+                capture_output=True, timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            build_logger.warning(f"Could not source ESP-IDF environment: {e}")
+            return None
+        if result.returncode != 0:
+            build_logger.warning(f"Sourcing {setup_path} failed with code {result.returncode}")
+            return None
+
+        env = {}
+        for item in result.stdout.decode('utf-8', 'replace').split('\0'):
+            if '=' in item:
+                key, value = item.split('=', 1)
+                env[key] = value
+        # Set once here rather than copying the dict per subprocess; keeps
+        # idf.py output line-buffered so the GUI log streams in real time
+        env['PYTHONUNBUFFERED'] = '1'
+        self._idf_env = env
+        self._idf_env_mtime = mtime_ns
+        build_logger.info(f"Cached ESP-IDF environment from {setup_path}")
+        return env
+
+    def _critical_config_hash(self) -> str:
+        """
+        Fingerprint the config values that invalidate build artifacts.
+        Covers the managed CAN options plus CRITICAL_CONFIG_KEYS; missing
+        keys hash as empty values so adding one later changes the hash.
+
+        Returns:
+            Hex digest of the critical configuration subset
+        """
+        keys = sorted(set(self.CRITICAL_CONFIG_KEYS) | self.kconfig_dict.all_ids)
+        parts = []
+        for key in keys:
+            line = self.sdkconfig.get_line_by_key(key)
+            parts.append(f"{key}={line.value if line else ''}")
+        return hashlib.sha256('\n'.join(parts).encode()).hexdigest()
+
+    def should_fullclean(self) -> bool:
         """
         Determine if full clean build is needed.
-        Currently always returns False - incremental builds only.
-        
-        Args:
-            old_config: Previous configuration (unused)
-            new_config: New configuration (unused)
-            
+        Compares the critical config hash against the one recorded in the
+        workspace after the last successful build.
+
         Returns:
-            False (incremental builds only)
+            True if critical configuration changed since the last build
         """
-        return False
+        marker_path = os.path.join(self._workspace_path, self.CRITICAL_HASH_FILE)
+        try:
+            with open(marker_path) as f:
+                previous_hash = f.read().strip()
+        except OSError:
+            # Fresh workspace - nothing stale to clean
+            return False
+        return previous_hash != self._critical_config_hash()
+
+    def _record_critical_hash(self) -> None:
+        """Persist the current critical config hash in the workspace."""
+        marker_path = os.path.join(self._workspace_path, self.CRITICAL_HASH_FILE)
+        try:
+            with open(marker_path, 'w') as f:
+                f.write(self._critical_config_hash())
+        except OSError as e:
+            build_logger.warning(f"Could not record critical config hash: {e}")
+
+    def _build_fingerprint(self) -> bytes:
+        """
+        Fingerprint the inputs that would change the built firmware:
+        the workspace sdkconfig content plus mtime/size of the top-level
+        CMakeLists.txt and every file in every source directory that
+        _switch_to_workspace symlinks into the build (main/, components/,
+        ... - recursively, so nested component sources count too).
+
+        Returns:
+            Raw digest bytes
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(os.path.join(self._workspace_path, 'sdkconfig'), 'rb') as f:
+                digest.update(f.read())
+        except OSError:
+            pass
+        src_root = os.getcwd()
+        paths = [os.path.join(src_root, 'CMakeLists.txt')]
+        # Same directory set _switch_to_workspace links: every non-hidden
+        # top-level directory except build/
+        try:
+            with os.scandir(src_root) as entries:
+                src_dirs = sorted(
+                    entry.path for entry in entries
+                    if entry.is_dir() and entry.name != 'build' and not entry.name.startswith('.')
+                )
+        except OSError:
+            src_dirs = []
+        for src_dir in src_dirs:
+            for dirpath, dirnames, filenames in os.walk(src_dir):
+                dirnames[:] = sorted(d for d in dirnames if not d.startswith('.'))
+                paths.extend(os.path.join(dirpath, name) for name in sorted(filenames))
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            digest.update(f"{path}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+        return digest.digest()
+
+    def _build_is_current(self) -> bool:
+        """
+        Check whether the workspace already holds a firmware built from the
+        current sources and sdkconfig, so compilation can be skipped.
+
+        Returns:
+            True if the recorded fingerprint matches and a .bin exists
+        """
+        marker_path = os.path.join(self._workspace_path, self.BUILD_FINGERPRINT_FILE)
+        try:
+            with open(marker_path, 'rb') as f:
+                recorded = f.read()
+        except OSError:
+            return False
+        if recorded != self._build_fingerprint():
+            return False
+        try:
+            with os.scandir(os.path.join(self._workspace_path, 'build')) as entries:
+                return any(entry.name.endswith('.bin') for entry in entries)
+        except OSError:
+            return False
+
+    def _record_build_fingerprint(self) -> None:
+        """Persist the current build fingerprint in the workspace."""
+        marker_path = os.path.join(self._workspace_path, self.BUILD_FINGERPRINT_FILE)
+        try:
+            with open(marker_path, 'wb') as f:
+                f.write(self._build_fingerprint())
+        except OSError as e:
+            build_logger.warning(f"Could not record build fingerprint: {e}")
@@ -11,16 +11,20 @@ using kconfiglib for structured configuration management.
 import logging
 import os
 import re
+import sys
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import FrozenSet, Optional
 from pprint import pprint
 import kconfiglib
 from py.log.rich_log_handler import LogSource, RichLogHandler
 
 logger = RichLogHandler.get_logger(LogSource.CONFIG)
 
+# Extracts symbol names from kconfiglib dependency expression strings
+_SYMBOL_RE = re.compile(r'<symbol ([A-Z0-9_]+)')
 
-@dataclass
+
+@dataclass(slots=True)
 class ConfigOption:
     """
     Configuration option from Kconfig file.
@@ -29,7 +33,7 @@ class ConfigOption:
     id: str
     display_name: str
     config_type: str
-    depends_on: Optional[List[str]] = None
+    depends_on: Optional[FrozenSet[str]] = None
 
     def __str__(self):
         return (
@@ -46,23 +50,47 @@ class KconfigMenuItems:
     Organizes options by menu name for easy access.
     """
 
-    def __init__(self, kconfig_path: str, menu_name: str):
+    def __init__(self, kconfig_path: str, menu_name: str, only_menus: Optional[set] = None):
         """
         Initialize and load Kconfig options.
-        
+
         Args:
             kconfig_path: Path to Kconfig.projbuild file
             menu_name: Parent menu name to search for
+            only_menus: Optional set of choice-menu prompts to extract eagerly;
+                options of other menus are extracted lazily on first
+                get_all_options()/all_ids access (None extracts everything)
         """
         self._menus_dict: dict[str, dict[str, ConfigOption]] = {}
+        self._flat_options: dict[str, ConfigOption] = {}
         self.kconfig_path = kconfig_path
         self.our_menu_name = None
+        self._menu_name = menu_name
+        self._only_menus = only_menus
+        self._fully_loaded = only_menus is None
+        self._kconf = None
         self._load_kconfig_options(kconfig_path, menu_name)
 
+    @property
+    def all_ids(self) -> FrozenSet[str]:
+        """IDs of every option in the file (triggers the full extraction)."""
+        self._ensure_fully_loaded()
+        return frozenset(self._flat_options)
+
+    def _ensure_fully_loaded(self):
+        """Extract options of menus skipped by only_menus, once, on demand."""
+        if self._fully_loaded:
+            return
+        self._fully_loaded = True
+        if self._kconf is not None:
+            # add_option overwrites existing entries, so re-walking the
+            # already-extracted menus is harmless
+            self._extract_options(self._kconf, self._menu_name, only_menus=None)
+
     def _load_kconfig_options(self, kconfig_path: str, expectedparent_menu_name: str):
         """
         Parse Kconfig file and extract choice menus with options.
-        
+
         Args:
             kconfig_path: Path to Kconfig file
             expectedparent_menu_name: Parent menu name to match
@@ -74,65 +102,85 @@ class KconfigMenuItems:
         try:
             kconf = kconfiglib.Kconfig(kconfig_path)
             logger.debug(f"Successfully loaded Kconfig from {kconfig_path}")
-
-            for node in kconf.node_iter():
-                if hasattr(node.item, 'choice') or str(type(node.item).__name__) == 'Choice':
-                    if not node.prompt:
-                        continue
-
-                    menu_name = node.prompt[0]
-                    logger.debug(f"Found choice menu: '{menu_name}'")
-
-                    parent_node = node.parent
-                    while parent_node:
-                        if hasattr(parent_node.item, 'prompt') and parent_node.prompt:
-                            parent_menu_name = parent_node.prompt[0]
-                            if parent_menu_name == expectedparent_menu_name:
-                                self.our_menu_name = parent_menu_name
-                                logger.info(f"Found our menu section: '{parent_menu_name}'")
-                                break
-                        parent_node = parent_node.parent
-
-                    choice_child = node.list
-                    while choice_child:
-                        if hasattr(choice_child.item, 'name') and hasattr(choice_child.item, 'type'):
-                            config_item = choice_child.item
-                            logger.debug(f"  Found config: {config_item.name}")
-
-                            display_name = choice_child.prompt[0] if choice_child.prompt else config_item.name
-
-                            depends_on = []
-                            if hasattr(config_item, 'direct_dep') and config_item.direct_dep != kconf.y:
-                                dep_str = str(config_item.direct_dep)
-                                logger.debug(f"    Raw dependency: {dep_str}")
-
-                                symbol_matches = re.findall(r'<symbol ([A-Z0-9_]+)', dep_str)
-                                if symbol_matches:
-                                    depends_on = symbol_matches
-                                    logger.debug(f"    Extracted symbols: {depends_on}")
-
-                            option = ConfigOption(
-                                id=config_item.name,
-                                display_name=display_name,
-                                config_type=str(config_item.type),
-                                depends_on=depends_on if depends_on else None
-                            )
-
-                            logger.debug(f"    Created option: {option}")
-                            self.add_option(menu_name, option)
-
-                        choice_child = choice_child.next
+            # Kept for the lazy completion pass in _ensure_fully_loaded
+            self._kconf = kconf
+            self._extract_options(kconf, expectedparent_menu_name, self._only_menus)
 
             logger.debug(f"Loaded {len(self._menus_dict)} menu(s) with total options")
             if self.our_menu_name:
                 logger.info(f"Will write configs to section: {self.our_menu_name}")
 
-        except Exception as e:
+        except (OSError, kconfiglib.KconfigError) as e:
             logger.error(f"Error loading Kconfig: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.debug("Kconfig load failed", exc_info=True)
             exit(1)
 
+    def _extract_options(self, kconf, expectedparent_menu_name: str, only_menus: Optional[set]):
+        """
+        Walk the parsed tree and extract choice menus with options.
+
+        Args:
+            kconf: Parsed kconfiglib.Kconfig instance
+            expectedparent_menu_name: Parent menu name to match
+            only_menus: Optional set of menu prompts to restrict extraction to
+        """
+        y_symbol = kconf.y
+
+        # Pre-order walk with an explicit stack. Each stack entry carries
+        # whether the subtree sits below the expected parent menu, so no
+        # per-choice ancestor re-walk is needed.
+        stack = [(kconf.top_node.list, False)]
+        while stack:
+            node, under_expected = stack.pop()
+            while node:
+                prompt = node.prompt[0] if node.prompt else None
+                is_choice = hasattr(node.item, 'choice') or str(type(node.item).__name__) == 'Choice'
+                if is_choice and prompt:
+                    menu_name = prompt
+                    logger.debug(f"Found choice menu: '{menu_name}'")
+
+                    if under_expected:
+                        self.our_menu_name = expectedparent_menu_name
+                        logger.info(f"Found our menu section: '{expectedparent_menu_name}'")
+
+                    if only_menus is None or menu_name in only_menus:
+                        choice_child = node.list
+                        while choice_child:
+                            if hasattr(choice_child.item, 'name') and hasattr(choice_child.item, 'type'):
+                                config_item = choice_child.item
+                                logger.debug(f"  Found config: {config_item.name}")
+
+                                display_name = choice_child.prompt[0] if choice_child.prompt else config_item.name
+
+                                depends_on = []
+                                if hasattr(config_item, 'direct_dep') and config_item.direct_dep != y_symbol:
+                                    dep_str = str(config_item.direct_dep)
+                                    logger.debug(f"    Raw dependency: {dep_str}")
+
+                                    symbol_matches = _SYMBOL_RE.findall(dep_str)
+                                    if symbol_matches:
+                                        depends_on = symbol_matches
+                                        logger.debug(f"    Extracted symbols: {depends_on}")
+
+                                option = ConfigOption(
+                                    # Interned ids let the many equality
+                                    # checks against selected lib/example
+                                    # ids take CPython's pointer fast path
+                                    id=sys.intern(config_item.name),
+                                    display_name=display_name,
+                                    config_type=str(config_item.type),
+                                    depends_on=frozenset(depends_on) if depends_on else None
+                                )
+
+                                logger.debug(f"    Created option: {option}")
+                                self.add_option(menu_name, option)
+
+                            choice_child = choice_child.next
+
+                if node.list:
+                    stack.append((node.list, under_expected or prompt == expectedparent_menu_name))
+                node = node.next
+
     def add_option(self, menu_name: str, option: ConfigOption):
         """
         Add configuration option to menu.
@@ -145,6 +193,7 @@ class KconfigMenuItems:
             self._menus_dict[menu_name][option.id] = option
         except KeyError:
             self._menus_dict[menu_name] = {option.id: option}
+        self._flat_options[option.id] = option
         logger.debug(f"Added option {option.id} to menu '{menu_name}'")
 
     def get_option_by_id(self, menu_name: str, id: str, default: ConfigOption = None) -> ConfigOption:
@@ -173,12 +222,12 @@ class KconfigMenuItems:
     def get_all_options(self) -> dict[str, ConfigOption]:
         """
         Get all options from all menus as flat dictionary.
-        
+        Completes a lazy (only_menus-restricted) load first; afterwards it
+        returns the dictionary maintained incrementally by add_option,
+        so repeated calls do not re-flatten the menus.
+
         Returns:
             Dictionary mapping option IDs to ConfigOption instances
         """
-        flat_dict = {}
-        for menu_name, options in self._menus_dict.items():
-            for option_id, option in options.items():
-                flat_dict[option_id] = option
-        return flat_dict
+        self._ensure_fully_loaded()
+        return self._flat_options
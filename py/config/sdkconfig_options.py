@@ -8,20 +8,26 @@ Manages configuration key-value pairs with in-place updates
 while preserving file structure and comments.
 '''
 
+import hashlib
 import logging
 import os
+import re
 from dataclasses import dataclass
 from typing import Optional, Dict, List
 from py.log.rich_log_handler import LogSource, RichLogHandler
 
 reconfig_logger = RichLogHandler.get_logger(LogSource.RECONFIG)
 
+# Matches "KEY=value" on a stripped line; comments and blanks do not match
+_CONFIG_LINE_RE = re.compile(r'([^#=][^=]*)=(.*)')
 
-@dataclass
+
+@dataclass(slots=True)
 class SdkconfigLine:
     """
     Single configuration line from sdkconfig file.
     Tracks key, value, and original line text for in-place updates.
+    Uses __slots__ since one instance exists per sdkconfig line.
     """
     key: str
     value: str
@@ -56,6 +62,10 @@ class Sdkconfig:
         self.menu_name = menu_name
         self._sdkconfig_lines: Dict[str, SdkconfigLine] = {}
         self._keys_to_lines_number: Dict[str, int] = {}
+        # Digest of the file content last read from / written to _disk_path,
+        # used by write() to skip IO when nothing changed
+        self._disk_digest: Optional[bytes] = None
+        self._disk_path: Optional[str] = None
         self._load_sdkconfig()
 
     def set_sdkconfig_path(self, sdkconfig_path: str) -> None:
@@ -78,24 +88,25 @@ class Sdkconfig:
 
         try:
             with open(self.sdkconfig_path, 'r') as f:
-                lines = f.readlines()
-
-            for i, line in enumerate(lines):
-                line = line.strip()
-                if not line or line.startswith('#'):
-                    continue
-
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    self._sdkconfig_lines[key] = SdkconfigLine(key, value, line + '\n')
-                    self._keys_to_lines_number[key] = i
+                raw_lines = f.read().splitlines()
+
+            entries = [
+                (i, *match.groups())
+                for i, match in enumerate(map(_CONFIG_LINE_RE.fullmatch, map(str.strip, raw_lines)))
+                if match
+            ]
+            self._sdkconfig_lines = {
+                key: SdkconfigLine(key, value, f"{key}={value}\n") for _, key, value in entries
+            }
+            self._keys_to_lines_number = {key: i for i, key, _ in entries}
+            self._disk_digest = self._content_digest()
+            self._disk_path = self.sdkconfig_path
 
             reconfig_logger.info(f"Loaded {len(self._sdkconfig_lines)} config options from {self.sdkconfig_path}")
 
-        except Exception as e:
+        except (OSError, UnicodeDecodeError) as e:
             reconfig_logger.error(f"Error loading sdkconfig: {e}")
-            import traceback
-            reconfig_logger.debug(traceback.format_exc())
+            reconfig_logger.debug("sdkconfig load failed", exc_info=True)
 
     def _normalize_key(self, key: str) -> str:
         """
@@ -122,6 +133,23 @@ class Sdkconfig:
         key = self._normalize_key(key)
         return self._sdkconfig_lines.get(key)
 
+    def get_lines_by_keys(self, keys: List[str]) -> tuple[Dict[str, SdkconfigLine], List[str]]:
+        """
+        Get configuration lines for many keys in one pass.
+        Avoids per-key lookups and exception handling for missing keys.
+
+        Args:
+            keys: Configuration keys (with or without CONFIG_ prefix)
+
+        Returns:
+            Tuple of (found lines keyed by the requested key, missing requested keys)
+        """
+        normalized = {self._normalize_key(key): key for key in keys}
+        present = self._sdkconfig_lines.keys() & normalized.keys()
+        found = {key: self._sdkconfig_lines[norm] for norm, key in normalized.items() if norm in present}
+        missing = [key for norm, key in normalized.items() if norm not in present]
+        return found, missing
+
     def add_no_existing_bool_keys(self, keys: List[str]) -> None:
         """
         Add missing boolean keys with default value 'n'.
@@ -129,29 +157,80 @@ class Sdkconfig:
         Args:
             keys: List of keys to check and add if missing
         """
-        for key in keys:
-            key = self._normalize_key(key)
-            if key not in self._sdkconfig_lines:
-                reconfig_logger.debug(f"Adding missing key: {key}")
-                self._sdkconfig_lines[key] = SdkconfigLine(key, 'n', f"{key}=n\n")
+        new_lines = {
+            key: SdkconfigLine(key, 'n', f"{key}=n\n")
+            for key in map(self._normalize_key, keys)
+            if key not in self._sdkconfig_lines
+        }
+        if new_lines:
+            reconfig_logger.debug(f"Adding missing keys: {list(new_lines)}")
+            self._sdkconfig_lines.update(new_lines)
+
+    def apply_values(self, updates: Dict[str, str]) -> int:
+        """
+        Apply many key -> value updates in one batch.
+        Only lines whose value actually differs are touched; unknown keys
+        are ignored (use add_no_existing_bool_keys to create them first).
+
+        Args:
+            updates: Mapping of configuration keys (with or without CONFIG_
+                prefix) to desired values
+
+        Returns:
+            Number of lines whose value changed
+        """
+        changed = 0
+        lines = self._sdkconfig_lines
+        for key, value in updates.items():
+            line = lines.get(self._normalize_key(key))
+            if line is not None and line.value != value:
+                line.set_value(value)
+                changed += 1
+                reconfig_logger.debug(f"Set {line.key}={value}")
+        return changed
+
+    def _content_digest(self) -> bytes:
+        """
+        Digest of the serialized configuration (the bytes write() would emit).
+
+        Returns:
+            Raw digest bytes
+        """
+        digest = hashlib.sha256()
+        for line in self._sdkconfig_lines.values():
+            digest.update(line.original_line.encode())
+        return digest.digest()
 
     def write(self) -> None:
         """
         Write configuration to sdkconfig file with backup.
         Creates .bak backup of existing file before writing.
+        Skips all IO when the content matches what was last read from or
+        written to the same path.
         """
         try:
+            new_digest = self._content_digest()
+            if new_digest == self._disk_digest and self._disk_path == self.sdkconfig_path:
+                reconfig_logger.info(f"sdkconfig content unchanged - skipping write to {self.sdkconfig_path}")
+                return
+            content = ''.join(line.original_line for line in self._sdkconfig_lines.values())
+            tmp_path = f"{self.sdkconfig_path}.tmp"
+            with open(tmp_path, 'w') as f:
+                f.write(content)
+                f.flush()
+                # Make the rename atomic in practice: the replace must not
+                # land before the data does
+                os.fsync(f.fileno())
+
             if os.path.exists(self.sdkconfig_path):
                 backup_path = f"{self.sdkconfig_path}.bak"
                 os.replace(self.sdkconfig_path, backup_path)
-
-            with open(self.sdkconfig_path, 'w') as f:
-                for line in self._sdkconfig_lines.values():
-                    f.write(line.original_line)
+            os.replace(tmp_path, self.sdkconfig_path)
+            self._disk_digest = new_digest
+            self._disk_path = self.sdkconfig_path
 
             reconfig_logger.info(f"Successfully wrote sdkconfig to {self.sdkconfig_path}")
 
-        except Exception as e:
+        except OSError as e:
             reconfig_logger.error(f"Error writing sdkconfig: {e}")
-            import traceback
-            reconfig_logger.debug(traceback.format_exc())
+            reconfig_logger.debug("sdkconfig write failed", exc_info=True)
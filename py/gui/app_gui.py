@@ -13,7 +13,6 @@ import os
 import time
 
 from textual.app import App, ComposeResult
-from textual.reactive import reactive
 from textual.widgets import Button, Footer, TabbedContent, TabPane
 from py.app_logic import FlashApp
 from py.monitor.shell_monitor_logic import ShellMonitorLogic
@@ -36,8 +35,6 @@ class AppGui(App):
         ("ctrl+q", "quit", "Quit"),
     ]
 
-    ports = reactive(list)
-
     def __init__(
             self,
             kconfig_path: str = "./main/Kconfig.projbuild",
@@ -56,22 +53,22 @@ class AppGui(App):
         """
         self._debug = debug
         super().__init__()
-        kconfig_path = os.path.expanduser(kconfig_path)
-        sdkconfig_path = os.path.expanduser(sdkconfig_path)
-        idf_setup_path = os.path.expanduser(idf_setup_path)
-        if not os.path.exists(kconfig_path):
-            python_logger.error(f"Kconfig file not found at: '{kconfig_path}'")
-            exit(1)
-        if not os.path.exists(sdkconfig_path):
-            python_logger.error(f"SDKconfig file not found at: '{sdkconfig_path}'")
-            exit(1)
-        if not os.path.exists(idf_setup_path):
-            python_logger.error(f"ESP-IDF setup script not found at: '{idf_setup_path}'")
-            exit(1)
+
+        def must_exist(path: str, label: str) -> str:
+            path = os.path.expanduser(path)
+            if not os.path.exists(path):
+                python_logger.error(f"{label} not found at: '{path}'")
+                exit(1)
+            return path
+
+        # ESP-IDF first - it is the most expensive prerequisite to fix
+        idf_setup_path = must_exist(idf_setup_path, "ESP-IDF setup script")
+        kconfig_path = must_exist(kconfig_path, "Kconfig file")
+        sdkconfig_path = must_exist(sdkconfig_path, "SDKconfig file")
 
         self.kconfig_path = kconfig_path
         self.sdkconfig_path = sdkconfig_path
-        self.idf_setup_path = os.path.expanduser(idf_setup_path)
+        self.idf_setup_path = idf_setup_path
         self.logic = FlashApp(
             idf_setup_path, 
             kconfig_path, 
@@ -81,11 +78,11 @@ class AppGui(App):
         )
         self.monitor_logic = ShellMonitorLogic(
             idf_setup_path=idf_setup_path,
-            read_timeout=0.001,
             chunk_size=4096,
             flush_interval=0.05
         )
-        self.ports, self.real_ports_found = self.logic.find_flash_ports()
+        self.ports = self.logic.find_flash_ports()
+        self.real_ports_found = self.logic.real_ports_found
 
     def compose(self) -> ComposeResult:
         with TabbedContent():
@@ -36,9 +36,17 @@ class BuildFlashTab(Container):
         self.gui_app = gui_app
         self.python_logger = python_logger
         self._debug = debug
+        # widget id -> (lib_select, example_select, flash_button) for its row
+        self._rows_by_widget_id = {}
+        # True while a build/flash worker is running; keeps flash buttons
+        # disabled so concurrent runs cannot fight over the workspace
+        self._flashing = False
 
     def _build_table(self) -> ComposeResult:
         """Generate build/flash table with port selection controls."""
+        # Drop rows from a previous compose so a recompose with a changed
+        # port list cannot leave stale widget references behind
+        self._rows_by_widget_id.clear()
         yield Static("Port", classes="header")
         yield Static("Library", classes="header")
         yield Static("Example", classes="header")
@@ -46,18 +54,23 @@ class BuildFlashTab(Container):
         for port in self.ports:
             yield Static(port, classes="port")
 
-            lib_choices = [(opt.display_name, opt.id) for opt in self.logic.lib_options]
-            yield Select(lib_choices, prompt="-- Select Lib --")
+            lib_select = Select(self.logic.lib_choices, prompt="-- Select Lib --", id=f"lib-{port}")
+            example_select = Select(
+                self.logic.example_choices, prompt="-- Select Example --", id=f"example-{port}")
 
-            example_choices = [(opt.display_name, opt.id) for opt in self.logic.example_options]
-            yield Select(example_choices, prompt="-- Select Example --")
-
-            yield Button(
+            flash_button = Button(
                 f"⚡ Flash {port}",
                 id=f"flash-{port}",
                 classes="flash-button",
                 disabled=True
             )
+            row = (lib_select, example_select, flash_button)
+            self._rows_by_widget_id[lib_select.id] = row
+            self._rows_by_widget_id[example_select.id] = row
+            self._rows_by_widget_id[flash_button.id] = row
+            yield lib_select
+            yield example_select
+            yield flash_button
 
     def compose(self) -> ComposeResult:
         """Compose the tab layout with table, log viewer, and toolbar."""
@@ -73,6 +86,7 @@ class BuildFlashTab(Container):
             markup=True,
         )
         with Container(id="build-flash-actions"):
+            yield Button("⚡ Flash All", id="flash-all", classes="toolbar-button")
             yield Button("🧹 Clear Log", id="clear-log", classes="toolbar-button")
             if self._debug:
                 yield Button("📊 Log Statistics", id="richlog-statistics", classes="toolbar-button")
@@ -96,44 +110,36 @@ class BuildFlashTab(Container):
 
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle library/example selection changes and update flash button state based on dependencies."""
-        grid = self.query_one("#table")
-        all_selects = list(grid.query(Select))
-        select_index = -1
-        for i, select in enumerate(all_selects):
-            if select == event.select:
-                select_index = i
-                break
-
-        if select_index >= 0:
-            row_index = select_index // 2
-            lib_select = all_selects[row_index * 2]
-            example_select = all_selects[row_index * 2 + 1]
-            flash_buttons = [btn for btn in grid.query(Button) if btn.id and btn.id.startswith("flash-")]
-            if row_index < len(flash_buttons):
-                flash_button = flash_buttons[row_index]
-                lib_selected = lib_select.value is not None and lib_select.value != Select.BLANK
-                example_selected = example_select.value is not None and example_select.value != Select.BLANK
-                dependencies_ok = True
-                if lib_selected and example_selected:
-                    dependencies_ok = self.logic.check_dependencies(lib_select.value, example_select.value)
-
-                    example_option = self.logic.get_example_option_by_id(example_select.value)
-                    if example_option and example_option.depends_on:
-                        lib_option = self.logic.get_lib_option_by_id(lib_select.value)
-                        msg_str = (
-                            f"Dependency check: {example_select.value} requires {example_option.depends_on}, "
-                            f"selected {lib_option.id if lib_option else 'unknown'} -> "
-                            f"{'OK' if dependencies_ok else 'FAIL'}"
-                        )
-                        if dependencies_ok:
-                            self.python_logger.debug(msg_str)
-                        else:
-                            self.python_logger.warning(msg_str)
-                all_conditions_met = lib_selected and example_selected and dependencies_ok
-                flash_button.disabled = not all_conditions_met
+        row = self._rows_by_widget_id.get(event.select.id)
+        if row is None:
+            return
+
+        lib_select, example_select, flash_button = row
+        lib_selected = lib_select.value is not None and lib_select.value != Select.BLANK
+        example_selected = example_select.value is not None and example_select.value != Select.BLANK
+        dependencies_ok = True
+        if lib_selected and example_selected:
+            dependencies_ok = self.logic.check_dependencies(lib_select.value, example_select.value)
+
+            example_option = self.logic.get_example_option_by_id(example_select.value)
+            if example_option and example_option.depends_on:
+                lib_option = self.logic.get_lib_option_by_id(lib_select.value)
+                msg_str = (
+                    f"Dependency check: {example_select.value} requires {example_option.depends_on}, "
+                    f"selected {lib_option.id if lib_option else 'unknown'} -> "
+                    f"{'OK' if dependencies_ok else 'FAIL'}"
+                )
+                if dependencies_ok:
+                    self.python_logger.debug(msg_str)
+                else:
+                    self.python_logger.warning(msg_str)
+        all_conditions_met = lib_selected and example_selected and dependencies_ok and not self._flashing
+        flash_button.disabled = not all_conditions_met
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id and event.button.id.startswith("flash-"):
+        if event.button.id == "flash-all":
+            self._on_flash_all_pressed(event)
+        elif event.button.id and event.button.id.startswith("flash-"):
             self._on_flash_pressed(event)
         elif event.button.id == "clear-log":
             self._on_clear_log_pressed(event)
@@ -144,21 +150,79 @@ class BuildFlashTab(Container):
 
     def _on_flash_pressed(self, event: Button.Pressed) -> None:
         """Handle flash button press - start async build and flash process."""
+        # _run_flash_job only raises _flashing once the worker runs; claim
+        # it here synchronously so a second press queued before the disable
+        # lands cannot start a concurrent job over the shared workspace
+        if self._flashing:
+            return
         port = event.button.id.replace("flash-", "")
-        grid = self.query_one("#table")
-        buttons = [btn for btn in grid.query(Button) if btn.id and btn.id.startswith("flash-")]
-
-        for i, btn in enumerate(buttons):
-            if btn == event.button:
-                base_idx = 4 + i * 4
-                lib_select = grid.children[base_idx + 1]
-                example_select = grid.children[base_idx + 2]
-                self.run_worker(
-                    self.logic.config_compile_flash(port, lib_select.value, example_select.value),
-                    name=f"flash_{port}"
-                )
-                break
-    
+        row = self._rows_by_widget_id.get(event.button.id)
+        if row is None:
+            return
+
+        lib_select, example_select, _ = row
+        self._flashing = True
+        self.run_worker(
+            self._run_flash_job(
+                self.logic.config_compile_flash(port, lib_select.value, example_select.value)),
+            name=f"flash_{port}"
+        )
+
+    def _on_flash_all_pressed(self, event: Button.Pressed) -> None:
+        """Collect every row with a valid selection and build/flash them as one batch."""
+        # Same synchronous claim as _on_flash_pressed: only one job may run
+        if self._flashing:
+            return
+        requests = []
+        for button_id, (lib_select, example_select, _) in self._rows().items():
+            if self._selection_ready(lib_select, example_select):
+                port = button_id.replace("flash-", "")
+                requests.append((port, lib_select.value, example_select.value))
+        if not requests:
+            self.python_logger.warning("Flash All: no row has a valid lib/example selection")
+            return
+        self.python_logger.info(f"Flash All: {len(requests)} port(s) queued")
+        self._flashing = True
+        self.run_worker(
+            self._run_flash_job(self.logic.config_compile_many(requests)),
+            name="flash_all"
+        )
+
+    def _rows(self) -> dict:
+        """Unique rows keyed by their flash button id."""
+        return {row[2].id: row for row in self._rows_by_widget_id.values()}
+
+    def _selection_ready(self, lib_select: Select, example_select: Select) -> bool:
+        """Check whether a row's selections form a flashable combination."""
+        lib_value = lib_select.value
+        example_value = example_select.value
+        if lib_value is None or lib_value == Select.BLANK:
+            return False
+        if example_value is None or example_value == Select.BLANK:
+            return False
+        return self.logic.check_dependencies(lib_value, example_value)
+
+    async def _run_flash_job(self, job) -> None:
+        """
+        Await a build/flash coroutine with every flash button disabled.
+        The workspace and sdkconfig state is shared across rows, so only one
+        job may be active at a time; buttons are re-evaluated afterwards.
+
+        Args:
+            job: Coroutine performing the build/flash work
+        """
+        self._flashing = True
+        rows = self._rows()
+        for _, _, flash_button in rows.values():
+            flash_button.disabled = True
+        try:
+            await job
+        finally:
+            self._flashing = False
+            for lib_select, example_select, flash_button in rows.values():
+                flash_button.disabled = not self._selection_ready(lib_select, example_select)
+
+
     def _on_clear_log_pressed(self, event: Button.Pressed) -> None:
         """Clear only the Build & Flash RichLog"""
         try:
@@ -34,6 +34,11 @@ class SerialMonitorsTab(Container):
         self.max_log_lines = max_log_lines
         self.active_monitor_logs = {}  # port -> Log widget
         self.monitor_visibility = {}  # port -> bool (True = visible, False = hidden)
+        self._buttons = {}  # Button -> (kind, port); avoids id parsing per click
+        self._pair = {}  # port -> (open_button, run_button)
+        self._containers_by_port = {}  # port -> monitor Container widget
+        self._last_rebalance_count = -1  # visible logs at last height update
+        self._placeholder = None  # placeholder Static while no monitor shown
         
         # Initialize monitor logic
         self.monitor_logic = monitor_logic
@@ -44,11 +49,20 @@ class SerialMonitorsTab(Container):
         yield Static("Open", classes="header")
         yield Static("Run", classes="header")
         yield Static("Clear", classes="header")
+        self._buttons.clear()
+        self._pair.clear()
         for port in self.ports:
             yield Static(port, classes="port-name")
-            yield Button("+ Show", id=f"open-{port}", classes="open-button", disabled=False)
-            yield Button("▶ Start", id=f"run-{port}", classes="run-button", disabled=False)
-            yield Button("🧹 Clear", id=f"clear-{port}", classes="clear-button", disabled=False)
+            open_button = Button("+ Show", id=f"open-{port}", classes="open-button", disabled=False)
+            run_button = Button("▶ Start", id=f"run-{port}", classes="run-button", disabled=False)
+            clear_button = Button("🧹 Clear", id=f"clear-{port}", classes="clear-button", disabled=False)
+            self._buttons[open_button] = ("open", port)
+            self._buttons[run_button] = ("run", port)
+            self._buttons[clear_button] = ("clear", port)
+            self._pair[port] = (open_button, run_button)
+            yield open_button
+            yield run_button
+            yield clear_button
 
     def compose(self) -> ComposeResult:
         with Container(id="serial-left-panel"):
@@ -57,19 +71,21 @@ class SerialMonitorsTab(Container):
                 yield from self._monitor_table()
 
         with Container(id="serial-right-panel"):
-            yield Static("Monitor Output - monitors will appear here", id="monitor-placeholder")
+            self._placeholder = Static(
+                "Monitor Output - monitors will appear here", id="monitor-placeholder")
+            yield self._placeholder
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        if event.button.id and event.button.id.startswith("open-"):
-            self._on_open_pressed(event)
-        elif event.button.id and event.button.id.startswith("run-"):
-            self._on_run_pressed(event)
-        elif event.button.id and event.button.id.startswith("clear-"):
-            self._on_clear_pressed(event)
-        
-    def _on_open_pressed(self, event: Button.Pressed) -> None:
+        kind, port = self._buttons.get(event.button, (None, None))
+        if kind == "open":
+            self._on_open_pressed(event, port)
+        elif kind == "run":
+            self._on_run_pressed(event, port)
+        elif kind == "clear":
+            self._on_clear_pressed(event, port)
+
+    def _on_open_pressed(self, event: Button.Pressed, port: str) -> None:
         """Handle open/hide button toggle for port visibility"""
-        port = event.button.id.replace("open-", "")
         current_text = str(event.button.label)
         
         if "Show" in current_text:
@@ -83,9 +99,8 @@ class SerialMonitorsTab(Container):
             self._remove_monitor_log(port)
             self.python_logger.debug(f"Hide monitor for port {port} (monitoring continues)")
 
-    def _on_run_pressed(self, event: Button.Pressed) -> None:
+    def _on_run_pressed(self, event: Button.Pressed, port: str) -> None:
         """Handle start/stop button toggle for port monitoring"""
-        port = event.button.id.replace("run-", "")
         current_text = str(event.button.label)
         
         if "Start" in current_text:
@@ -95,7 +110,7 @@ class SerialMonitorsTab(Container):
             # If monitor log is not visible, show it first
             if port not in self.active_monitor_logs:
                 # Update open button to Hide state
-                open_button = self.query_one(f"#open-{port}")
+                open_button = self._pair[port][0]
                 open_button.label = "- Hide"
                 self._add_monitor_log(port)
                 self.python_logger.debug(f"Auto-opened monitor log for port {port}")
@@ -109,9 +124,8 @@ class SerialMonitorsTab(Container):
             self.app.run_worker(self._stop_monitoring(port), exclusive=False)
             self.python_logger.debug(f"Stop monitoring port {port}")
 
-    def _on_clear_pressed(self, event: Button.Pressed) -> None:
+    def _on_clear_pressed(self, event: Button.Pressed, port: str) -> None:
         """Clear log content for the given port if the log exists."""
-        port = event.button.id.replace("clear-", "")
         try:
             if port in self.active_monitor_logs:
                 serial_logger = self.active_monitor_logs[port]
@@ -132,37 +146,36 @@ class SerialMonitorsTab(Container):
             # Check if Log already exists
             if port in self.active_monitor_logs:
                 # Log exists, just show it
-                container = self.query_one(f"#monitor-container-{port}")
+                container = self._containers_by_port[port]
                 container.styles.display = "block"
                 self.monitor_visibility[port] = True
                 self.python_logger.debug(f"Showed existing monitor log for port {port}")
             else:
-                # Create new Log
-                monitor_container = Container(id=f"monitor-container-{port}", classes="monitor-container")
+                # Create new Log; build the subtree detached and mount it
+                # once, so the panel lays out one time instead of three
                 title = Static(f"Monitor: {port}", classes="monitor-title")
                 serial_logger = Log(
                     id=f"serial-logger-{port}",
                     classes="serial-logger",
                     max_lines=self.max_log_lines
                 )
-                
-                # Mount container and then add content
+                monitor_container = Container(
+                    title, serial_logger,
+                    id=f"monitor-container-{port}", classes="monitor-container"
+                )
                 right_panel.mount(monitor_container)
-                monitor_container.mount(title)
-                monitor_container.mount(serial_logger)
                 
-                # Store reference
+                # Store references
                 self.active_monitor_logs[port] = serial_logger
+                self._containers_by_port[port] = monitor_container
                 self.monitor_visibility[port] = True
                 
                 self.python_logger.debug(f"Created monitor log for port {port}")
             
-            # Remove placeholder if it exists
-            try:
-                placeholder = self.query_one("#monitor-placeholder")
-                placeholder.remove()
-            except:
-                pass
+            # Remove placeholder if it is still mounted
+            if self._placeholder is not None:
+                self._placeholder.remove()
+                self._placeholder = None
             
             # Rebalance heights of visible logs
             self._rebalance_monitor_logs()
@@ -174,7 +187,7 @@ class SerialMonitorsTab(Container):
         """Hide Log for monitoring port output (don't delete it)"""
         try:
             if port in self.active_monitor_logs:
-                container = self.query_one(f"#monitor-container-{port}")
+                container = self._containers_by_port[port]
                 container.styles.display = "none"
                 self.monitor_visibility[port] = False
                 
@@ -182,13 +195,11 @@ class SerialMonitorsTab(Container):
                 
                 # Check if we need to restore placeholder (all logs hidden)
                 if not any(self.monitor_visibility.values()):
-                    right_panel = self.query_one("#serial-right-panel")
-                    try:
-                        # Only add placeholder if it doesn't exist
-                        self.query_one("#monitor-placeholder")
-                    except:
-                        placeholder = Static("Monitor Output - monitors will appear here", id="monitor-placeholder")
-                        right_panel.mount(placeholder)
+                    if self._placeholder is None:
+                        right_panel = self.query_one("#serial-right-panel")
+                        self._placeholder = Static(
+                            "Monitor Output - monitors will appear here", id="monitor-placeholder")
+                        right_panel.mount(self._placeholder)
                 else:
                     # Rebalance remaining visible logs
                     self._rebalance_monitor_logs()
@@ -207,18 +218,23 @@ class SerialMonitorsTab(Container):
             
             if visible_count == 0:
                 return
+
+            # Heights depend only on the visible count; skip the style
+            # writes when it has not changed since the last rebalance
+            if visible_count == self._last_rebalance_count:
+                return
+            self._last_rebalance_count = visible_count
                 
             # Calculate height per visible container (equal distribution)
             height_per_container = f"{100 // visible_count}%"
             
-            # Apply height only to visible containers
+            # Apply height only to visible containers; cached references,
+            # no DOM query per port
             for port, visible in self.monitor_visibility.items():
                 if visible:
-                    try:
-                        container = self.query_one(f"#monitor-container-{port}")
+                    container = self._containers_by_port.get(port)
+                    if container is not None:
                         container.styles.height = height_per_container
-                    except:
-                        pass
                 
             self.python_logger.debug(f"Rebalanced {visible_count} visible serial loggers")
             
@@ -8,11 +8,16 @@ Prevents GUI freezing during high-frequency log output by batching writes.
 Includes emergency flush on errors and async-safe operations.
 '''
 from textual.widgets import RichLog
+import re
 import time
 import asyncio
 from typing import Any, Optional
 from rich.markup import escape
 
+# Content that forces an immediate flush; one case-insensitive C-level scan
+# per write instead of lowercasing the line and testing four substrings
+_FLUSH_NOW_RE = re.compile(r'error|failed|exception|❌', re.IGNORECASE)
+
 
 class RichLogExtended(RichLog):
     """
@@ -84,8 +89,7 @@ class RichLogExtended(RichLog):
         
         self.buffer.append(write_params)
         
-        content_str = str(content)
-        if any(error_word in content_str.lower() for error_word in ['error', 'failed', 'exception', '❌']):
+        if _FLUSH_NOW_RE.search(str(content)):
             self._flush_buffer()
             return self
         
@@ -116,51 +120,96 @@ class RichLogExtended(RichLog):
         if self.buffer:
             self._flush_buffer()
     
+    # Default write() parameters; consecutive plain-string writes using
+    # these can be joined into a single widget update per flush
+    _DEFAULT_WRITE_PARAMS = {
+        'width': None,
+        'expand': False,
+        'shrink': True,
+        'scroll_end': None,
+        'animate': False,
+    }
+
+    def _write_safe(self, write_params: dict) -> None:
+        """
+        Write one buffered entry to the parent RichLog.
+        Handles MarkupError by escaping problematic characters.
+
+        Args:
+            write_params: Keyword arguments for RichLog.write
+        """
+        try:
+            super().write(**write_params)
+        except Exception as e:
+            # If markup parsing fails, escape the content and try again
+            if 'MarkupError' in str(type(e).__name__):
+                content = write_params.get('content', '')
+                if isinstance(content, str):
+                    # Escape markup characters and retry
+                    write_params['content'] = escape(str(content))
+                    try:
+                        super().write(**write_params)
+                    except Exception:
+                        # If still failing, write without any formatting
+                        write_params['content'] = str(content).replace('[', '(').replace(']', ')')
+                        super().write(**write_params)
+            else:
+                # Re-raise non-markup errors
+                raise
+
+    def _drain_batch(self, batch: list) -> None:
+        """
+        Write a run of plain-string lines as one joined widget update.
+
+        Args:
+            batch: Buffered string contents; cleared after writing
+        """
+        if not batch:
+            return
+        self._write_safe(dict(self._DEFAULT_WRITE_PARAMS, content='\n'.join(batch)))
+        self.total_lines += len(batch)
+        if self.max_lines and self.total_lines > self.max_lines:
+            super().clear()
+            self.total_lines = 0
+        batch.clear()
+
     def _flush_buffer(self) -> None:
         """
         Flush all buffered writes to parent RichLog.
-        Updates statistics and respects max_lines limit.
-        Handles MarkupError by escaping problematic characters.
+        Runs of plain-string writes with default parameters are joined and
+        written as a single update, so a full buffer costs one render
+        instead of one per line. Updates statistics and respects max_lines.
         """
         if not self.buffer:
             return
-        
+
         if self._flush_timer and not self._flush_timer.done():
             self._flush_timer.cancel()
-        
+
         flush_start = time.time()
-        
+
+        batch = []
         for write_params in self.buffer:
-            try:
-                super().write(**write_params)
-            except Exception as e:
-                # If markup parsing fails, escape the content and try again
-                if 'MarkupError' in str(type(e).__name__):
-                    content = write_params.get('content', '')
-                    if isinstance(content, str):
-                        # Escape markup characters and retry
-                        write_params['content'] = escape(str(content))
-                        try:
-                            super().write(**write_params)
-                        except Exception:
-                            # If still failing, write without any formatting
-                            write_params['content'] = str(content).replace('[', '(').replace(']', ')')
-                            super().write(**write_params)
-                else:
-                    # Re-raise non-markup errors
-                    raise
-            
+            content = write_params['content']
+            if isinstance(content, str) and all(
+                write_params[key] == value
+                for key, value in self._DEFAULT_WRITE_PARAMS.items()
+            ):
+                batch.append(content)
+                continue
+            self._drain_batch(batch)
+            self._write_safe(write_params)
             self.total_lines += 1
-            
             if self.max_lines and self.total_lines > self.max_lines:
                 super().clear()
                 self.total_lines = 0
-        
+        self._drain_batch(batch)
+
         flush_time = time.time() - flush_start
         self.flush_count += 1
         self.total_flush_time += flush_time
         self.avg_flush_time = self.total_flush_time / self.flush_count
-        
+
         self.buffer.clear()
         self._last_flush = time.time()
     
@@ -14,6 +14,13 @@ from enum import Enum
 from textual.widgets import RichLog
 from py.log.rich_log_extended import RichLogExtended
 
+# Every build-output line passes through a LogRecord; skip the thread,
+# process and multiprocessing introspection logging performs per record,
+# none of which appears in the '%(message)s'-style output used here
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 
 class LogSource(Enum):
     """
@@ -117,6 +124,9 @@ class RichLogHandler(logging.Handler):
         self._source = source
         self._source_display_name = display_name
         self._extra_color = extra_color
+        # Prefix is constant per handler; building it once avoids the
+        # f-string and attribute lookups on every emitted line
+        self._prefix = f"{source.emoji} {display_name or source.display_name}: "
 
     def emit(self, record: logging.LogRecord):
         """
@@ -128,8 +138,10 @@ class RichLogHandler(logging.Handler):
         if self._rich_log:
             record = self._modify_record(record)
             msg = self.format(record)
+            # No explicit refresh: RichLog.write already invalidates the
+            # widget, and an eager refresh per record would defeat the
+            # batching in RichLogExtended
             self._rich_log.write(msg)
-            self._rich_log.refresh()
 
     def _modify_record(self, record: logging.LogRecord) -> logging.LogRecord:
         """
@@ -155,10 +167,7 @@ class RichLogHandler(logging.Handler):
         Returns:
             Modified record with prefixed message
         """
-        if self._source_display_name:
-            record.msg = f"{self._source.emoji} {self._source_display_name}: {record.msg}"
-        else:
-            record.msg = f"{self._source.emoji} {self._source.display_name}: {record.msg}"
+        record.msg = f"{self._prefix}{record.msg}"
         return record
 
     def _modify_level(self, record: logging.LogRecord = None) -> logging.LogRecord:
@@ -10,8 +10,12 @@ Supports both real serial ports and fake monitoring for testing.
 
 import os
 import asyncio
-from typing import Dict
+import random
+import termios
+from collections import deque
+from typing import Dict, Optional
 from py.shell_commands import ShellCommandConfig
+from py.monitor.fake_monitor_script import boot_lines, random_can_line, random_error_line
 
 
 class PortMonitorProcess:
@@ -25,125 +29,212 @@ class PortMonitorProcess:
             self,
             config: ShellCommandConfig,
             port_log_widget,
-            read_timeout: float = 0.001,
             chunk_size: int = 4096,
-            flush_interval: float = 0.05
+            flush_interval: float = 0.05,
+            device: Optional[str] = None
     ):
         """
         Initialize monitor process.
-        
+
         Args:
             config: Shell command configuration with monitor command
             port_log_widget: Log widget to write output to
-            read_timeout: Timeout for subprocess read operations (seconds)
             chunk_size: Bytes to read per operation (larger = faster)
             flush_interval: Minimum interval between writes to widget (seconds)
+            device: Optional device path (e.g. /dev/ttyACM0); when given, the
+                device is read directly via the event loop instead of through
+                a subprocess
         """
         self.config = config
         self.port_log_widget = port_log_widget
         self.process = None
         self.running = False
-        self.read_timeout = read_timeout
         self.chunk_size = chunk_size
         self.flush_interval = flush_interval
-        self.stdout_buffer = ""
-        self.stderr_buffer = ""
+        self.device = device
+        self._device_fd = None
+        self._device_closed = asyncio.Event()
         self.stdout_task = None
         self.stderr_task = None
-        self.last_flush_time = 0.0
+        # Byte chunks waiting for the flusher; bounded so a widget stall
+        # under a flooding device drops old output instead of growing
+        # without limit
+        self._pending: deque = deque(maxlen=512)
+        self._flush_event = asyncio.Event()
+        self._flusher_task = None
         
     async def start(self) -> int:
         """
-        Start subprocess and begin streaming output to log widget.
-        
+        Start streaming output to the log widget.
+        Real devices are read directly from their file descriptor; the
+        subprocess path is kept for the fake monitor script.
+
         Returns:
-            Process return code
+            Process return code (0 for a cleanly closed device)
         """
+        if self.device is not None:
+            return await self._start_device()
         try:
-            self.process = await asyncio.create_subprocess_shell(
-                self.config.command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            if isinstance(self.config.command, list):
+                # Argv form: exec the program directly, no shell in between
+                self.process = await asyncio.create_subprocess_exec(
+                    *self.config.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            else:
+                self.process = await asyncio.create_subprocess_shell(
+                    self.config.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
             self.running = True
             
-            self.stdout_task = asyncio.create_task(self._stream_output(self.process.stdout, prefix=""))
-            self.stderr_task = asyncio.create_task(self._stream_output(self.process.stderr, prefix="STDERR: "))
-            await self.process.wait()
+            self.stdout_task = asyncio.create_task(self._stream_output(self.process.stdout))
+            self.stderr_task = asyncio.create_task(self._stream_output(self.process.stderr, prefix=b"STDERR: "))
+            self._flusher_task = asyncio.create_task(self._flusher())
+            # Drain the readers first (they end on EOF or fed EOF from
+            # terminate), then collect the exit status
             await asyncio.gather(self.stdout_task, self.stderr_task, return_exceptions=True)
-            
-            return self.process.returncode
+            returncode = await self.process.wait()
+            self.running = False
+            self._flush_event.set()
+            await self._flusher_task
+
+            return returncode
             
         except Exception as e:
             self._write_to_textarea(f"Process failed: {e}\n")
             return -1
-            
-    async def _stream_output(self, stream, prefix: str = ""):
+
+    async def _start_device(self) -> int:
+        """
+        Read the serial device directly with loop.add_reader.
+        No shell, no cat, no pipe copy: the event loop wakes the callback
+        exactly when bytes are available on the descriptor.
+
+        Returns:
+            0 when the device closed cleanly, -1 on open/configure failure
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            fd = os.open(self.device, os.O_RDONLY | os.O_NONBLOCK | os.O_NOCTTY)
+        except OSError as e:
+            self._write_to_textarea(f"Could not open {self.device}: {e}\n")
+            return -1
+        try:
+            self._configure_serial(fd)
+        except termios.error as e:
+            # Not a tty (or odd driver) - still readable, just unconfigured
+            self._write_to_textarea(f"Could not configure {self.device}: {e}\n")
+
+        self._device_fd = fd
+        self.running = True
+        self._device_closed.clear()
+        loop.add_reader(fd, self._on_device_readable)
+        self._flusher_task = asyncio.create_task(self._flusher())
+        try:
+            await self._device_closed.wait()
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
+            self._device_fd = None
+            self.running = False
+            self._flush_event.set()
+            await self._flusher_task
+        return 0
+
+    def _on_device_readable(self) -> None:
+        """Event-loop callback: move available device bytes to the flusher."""
+        try:
+            data = os.read(self._device_fd, self.chunk_size)
+        except BlockingIOError:
+            return
+        except OSError:
+            self._device_closed.set()
+            return
+        if not data:
+            self._device_closed.set()
+            return
+        self._pending.append(data)
+        self._flush_event.set()
+
+    def _configure_serial(self, fd: int) -> None:
+        """
+        Apply the serial settings previously done by stty:
+        115200 baud, raw, no echo, no software or hardware flow control.
+
+        Args:
+            fd: Open device file descriptor
+        """
+        iflag, oflag, cflag, lflag, ispeed, ospeed, cc = termios.tcgetattr(fd)
+        iflag &= ~(termios.IXON | termios.IXOFF | termios.IXANY |
+                   termios.ICRNL | termios.INLCR | termios.IGNCR | termios.ISTRIP)
+        oflag &= ~termios.OPOST
+        cflag &= ~(termios.CRTSCTS | termios.PARENB | termios.CSTOPB | termios.CSIZE)
+        cflag |= termios.CS8 | termios.CREAD | termios.CLOCAL
+        lflag &= ~(termios.ECHO | termios.ECHONL | termios.ICANON |
+                   termios.ISIG | termios.IEXTEN)
+        ispeed = ospeed = termios.B115200
+        termios.tcsetattr(fd, termios.TCSANOW, [iflag, oflag, cflag, lflag, ispeed, ospeed, cc])
+
+    async def _stream_output(self, stream, prefix: bytes = b""):
         """
         Stream subprocess output to log widget with optimized buffering.
         Reads larger chunks and flushes periodically for better performance.
-        
+
         Args:
             stream: Asyncio stream to read from (stdout or stderr)
-            prefix: Prefix string for output lines (e.g., "STDERR: ")
+            prefix: Prefix for output chunks (e.g., b"STDERR: ")
         """
         try:
-            buffer = ""
-            last_flush = asyncio.get_event_loop().time()
-            
+            # No read timeout: the await resumes exactly when data arrives
+            # (or the pipe closes on process exit), instead of waking ~1000
+            # times per second to find an empty pipe
             while self.running:
-                try:
-                    data = await asyncio.wait_for(
-                        stream.read(self.chunk_size), 
-                        timeout=self.read_timeout
-                    )
-                    if not data:
-                        break
-                    
-                    chunk = data.decode('utf-8', errors='replace')
-                    buffer += chunk
-                    
-                    current_time = asyncio.get_event_loop().time()
-                    time_since_flush = current_time - last_flush
-                    
-                    should_flush = (
-                        '\n' in chunk or
-                        len(buffer) >= self.chunk_size or
-                        time_since_flush >= self.flush_interval
-                    )
-                    
-                    if should_flush and buffer:
-                        self._write_to_textarea(f"{prefix}{buffer}")
-                        buffer = ""
-                        last_flush = current_time
-                        
-                except asyncio.TimeoutError:
-                    if buffer:
-                        current_time = asyncio.get_event_loop().time()
-                        if current_time - last_flush >= self.flush_interval:
-                            self._write_to_textarea(f"{prefix}{buffer}")
-                            buffer = ""
-                            last_flush = current_time
-                    continue
-                except Exception as e:
-                    self._write_to_textarea(f"Stream error: {e}\n")
+                data = await stream.read(self.chunk_size)
+                if not data:
                     break
-                    
-            if buffer:
-                self._write_to_textarea(f"{prefix}{buffer}")
-                    
+
+                self._pending.append(prefix + data if prefix else data)
+                self._flush_event.set()
+
         except Exception as e:
             self._write_to_textarea(f"Stream error: {e}\n")
+
+    async def _flusher(self):
+        """
+        Drain pending chunks into the log widget at a bounded cadence.
+        However fast the device produces output, the widget sees at most
+        one joined write per flush_interval, so render cost stays constant.
+        """
+        while self.running or self._pending:
+            if self._pending:
+                chunks = list(self._pending)
+                self._pending.clear()
+                # One join and one decode per flush; decoding the joined
+                # buffer also repairs multibyte sequences split across reads.
+                # Carriage returns are dropped here with a C-level byte-table
+                # pass instead of rebuilding the decoded string
+                flat = b''.join(chunks).translate(None, delete=b'\r')
+                self._write_to_textarea(flat.decode('utf-8', errors='replace'))
+                # Pace the next write; chunks arriving meanwhile coalesce
+                await asyncio.sleep(self.flush_interval)
+                continue
+            self._flush_event.clear()
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
     
     def _write_to_textarea(self, text: str) -> None:
         """
         Write text to log widget.
-        Removes carriage return characters for clean output.
-        
+        Callers are expected to have stripped carriage returns already.
+
         Args:
             text: Text to write to widget
         """
-        text = text.replace('\r', '')
         try:
             self.port_log_widget.write(text)
         except Exception as e:
@@ -165,6 +256,10 @@ class PortMonitorProcess:
         Tries SIGTERM first, then SIGKILL if needed.
         Waits for stream tasks to complete.
         """
+        if self.device is not None:
+            # Raw-fd path: wake _start_device, which unregisters and closes
+            self._device_closed.set()
+            return
         if self.process and self.running:
             self.running = False
             try:
@@ -174,9 +269,17 @@ class PortMonitorProcess:
                 except asyncio.TimeoutError:
                     self.process.kill()
                     await self.process.wait()
-                if self.stdout_task:
+                # A child of the shell may still hold the pipes open; feed
+                # EOF so the readers return instead of waiting on it
+                if self.process.stdout is not None:
+                    self.process.stdout.feed_eof()
+                if self.process.stderr is not None:
+                    self.process.stderr.feed_eof()
+                # After the process exits the readers usually finished on
+                # EOF already; skip creating a timer for a done task
+                if self.stdout_task and not self.stdout_task.done():
                     await asyncio.wait_for(self.stdout_task, timeout=0.5)
-                if self.stderr_task:
+                if self.stderr_task and not self.stderr_task.done():
                     await asyncio.wait_for(self.stderr_task, timeout=0.5)
                     
             except asyncio.TimeoutError:
@@ -185,20 +288,66 @@ class PortMonitorProcess:
                 print(f"Error terminating process: {e}")
 
 
+class FakeMonitorProcess:
+    """
+    In-process fake monitor generating the same output as
+    fake_monitor_script.py, without spawning a python3 subprocess.
+    Exposes the run_end_wait()/terminate() API of PortMonitorProcess.
+    """
+
+    def __init__(self, port: str, port_log_widget, interval: float = 0.1):
+        """
+        Initialize fake monitor.
+
+        Args:
+            port: Fake port identifier (e.g., "Port1")
+            port_log_widget: Log widget to write output to
+            interval: Delay between generated lines (seconds)
+        """
+        self.port = port
+        self.port_log_widget = port_log_widget
+        self.interval = interval
+        self.running = False
+
+    async def run_end_wait(self) -> bool:
+        """
+        Generate fake output until terminated.
+
+        Returns:
+            True (the fake monitor cannot fail)
+        """
+        self.running = True
+        write = self.port_log_widget.write
+        for line in boot_lines(self.port):
+            if not self.running:
+                return True
+            write(line + '\n')
+            await asyncio.sleep(self.interval)
+
+        message_counter = 1266
+        while self.running:
+            write(random_can_line(message_counter) + '\n')
+            message_counter += 1
+            await asyncio.sleep(self.interval)
+            if random.random() < 0.1:  # 10% chance of an error line
+                write(random_error_line(message_counter) + '\n')
+                message_counter += 1
+        return True
+
+    async def terminate(self) -> None:
+        """Stop the generator loop; it exits within one interval."""
+        self.running = False
+
+
 class ShellMonitorLogic:
     """
     Manager for multiple serial port monitor processes.
     Handles starting, stopping, and tracking monitor subprocesses.
     Supports both real serial ports (/dev/ttyACM*, /dev/ttyUSB*) and fake ports for testing.
     """
-    BAUD_RATE = 115200
-    PORT_PARAMS = 'raw -echo -ixon -ixoff -crtscts'
-
-    
     def __init__(
         self, 
         idf_setup_path: str = "~/esp/v5.4.1/esp-idf/export.sh",
-        read_timeout: float = 0.001,
         chunk_size: int = 4096,
         flush_interval: float = 0.05
     ):
@@ -207,12 +356,10 @@ class ShellMonitorLogic:
         
         Args:
             idf_setup_path: Path to ESP-IDF environment setup script
-            read_timeout: Subprocess read timeout in seconds
             chunk_size: Bytes to read per operation (larger = faster throughput)
             flush_interval: Minimum interval between writes to widget (seconds)
         """
         self.idf_setup_path = os.path.expanduser(idf_setup_path)
-        self.read_timeout = read_timeout
         self.chunk_size = chunk_size
         self.flush_interval = flush_interval
         self.active_monitors: Dict[str, PortMonitorProcess] = {}
@@ -236,20 +383,22 @@ class ShellMonitorLogic:
             
         self.port_loggers[port] = monitor_log_widget
         if port.startswith("Port"):
-            command = self._create_fake_monitor_command(port)
+            # Fake ports are generated in-process; no interpreter startup,
+            # no subprocess, no pipes
+            process = FakeMonitorProcess(port, monitor_log_widget)
         else:
-            command = self._create_real_monitor_command(port)
-        config = ShellCommandConfig(
-            name=f"Monitor {port}",
-            command=command
-        )
-        process = PortMonitorProcess(
-            config=config, 
-            port_log_widget=monitor_log_widget,
-            read_timeout=self.read_timeout,
-            chunk_size=self.chunk_size,
-            flush_interval=self.flush_interval
-        )
+            # Real ports are read straight from the device fd
+            config = ShellCommandConfig(
+                name=f"Monitor {port}",
+                command=f"read /dev/{port}"
+            )
+            process = PortMonitorProcess(
+                config=config,
+                port_log_widget=monitor_log_widget,
+                chunk_size=self.chunk_size,
+                flush_interval=self.flush_interval,
+                device=f"/dev/{port}"
+            )
         
         self.active_monitors[port] = process
         worker = gui_run_worker_method(
@@ -278,17 +427,18 @@ class ShellMonitorLogic:
         if port in self.worker_tasks:
             worker = self.worker_tasks[port]
             try:
-                await asyncio.wait_for(worker.wait(), timeout=2.0)
+                if not getattr(worker, 'is_finished', False):
+                    await asyncio.wait_for(worker.wait(), timeout=2.0)
             except asyncio.TimeoutError:
                 print(f"Worker for port {port} didn't finish in time")
             except Exception as e:
                 print(f"Error waiting for worker: {e}")
             del self.worker_tasks[port]
-        
-        del self.active_monitors[port]
-        if port in self.port_loggers:
-            del self.port_loggers[port]
-            
+
+        # The worker's own cleanup may have removed these already
+        self.active_monitors.pop(port, None)
+        self.port_loggers.pop(port, None)
+
         return True
         
     def is_monitoring(self, port: str) -> bool:
@@ -302,44 +452,17 @@ class ShellMonitorLogic:
         Returns:
             Count of stopped monitors
         """
-        stopped_count = 0
-        ports_to_stop = list(self.active_monitors.keys())
-        
-        for port in ports_to_stop:
-            try:
-                if await self.stop_monitor_for_gui(port):
-                    stopped_count += 1
-            except Exception as e:
-                print(f"Error stopping monitor for port {port}: {e}")
-                
-        return stopped_count
-        
-    def _create_fake_monitor_command(self, port: str) -> str:
-        """
-        Create command for fake monitor script.
-        
-        Args:
-            port: Fake port identifier (e.g., "Port1")
-            
-        Returns:
-            Shell command string
-        """
-        script_path = os.path.join(os.path.dirname(__file__), 'fake_monitor_script.py')
-        return f"python3 {script_path} {port}"
-        
-    def _create_real_monitor_command(self, port: str) -> str:
-        """
-        Create command for real serial port monitoring.
-        Uses stty for port configuration and cat for reading.
+        # Terminations are independent per port; run them concurrently so
+        # shutdown latency is one port's worth, not the sum
+        results = await asyncio.gather(
+            *(self.stop_monitor_for_gui(port) for port in list(self.active_monitors)),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error stopping monitor: {result}")
+        return sum(1 for result in results if result is True)
         
-        Args:
-            port: Serial port name (e.g., "ttyACM0")
-            
-        Returns:
-            Shell command string
-        """
-        return f'stty -F /dev/{port} {self.BAUD_RATE} {self.PORT_PARAMS} && cat /dev/{port}'
-
     async def run_monitor_with_cleanup(self, port: str) -> bool:
         """
         Run monitor process with automatic cleanup on completion.
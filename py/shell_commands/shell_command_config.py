@@ -13,13 +13,18 @@ class ShellCommandConfig:
     Configuration container for shell command execution.
     Simple dataclass holding command name and command string.
     """
-    def __init__(self, name: str, command: str):
+    def __init__(self, name: str, command, env: dict = None, cwd: str = None):
         """
         Initialize shell command configuration.
-        
+
         Args:
             name: Human-readable command name for logging
-            command: Shell command string to execute
+            command: Shell command string, or an argv list to execute the
+                program directly without spawning a shell
+            env: Optional environment for the subprocess (inherited if None)
+            cwd: Optional working directory for the subprocess
         """
-        self.name = name or command
+        self.name = name or (' '.join(command) if isinstance(command, list) else command)
         self.command = command
+        self.env = env
+        self.cwd = cwd
@@ -13,6 +13,49 @@ import logging
 import re
 from py.shell_commands.shell_command_config import ShellCommandConfig
 
+# Error patterns merged into one regex so each output line costs a single
+# C-level scan instead of one re.search per pattern
+_ERROR_RE = re.compile(
+    r"could not open port"
+    r"|No such file or directory"
+    r"|Permission denied"
+    r"|Device or resource busy"
+    r"|Connection refused"
+    r"|Error:"
+    r"|Failed:"
+    r"|Exception:"
+    r"|Traceback"
+    r"|\[Errno \d+\]"  # System error codes
+    r"|command not found"
+    r"|bash:.*: No such file or directory",
+    re.IGNORECASE,
+)
+
+# Strips any ANSI escape sequence left after the markup translation
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*[mK]')
+
+_ANSI_TO_RICH = {
+    '[0;30m': '[black]',        # Black
+    '[0;31m': '[red]',          # Red
+    '[0;32m': '[green]',        # Green
+    '[0;33m': '[yellow]',       # Yellow
+    '[0;34m': '[blue]',         # Blue
+    '[0;35m': '[magenta]',      # Magenta
+    '[0;36m': '[cyan]',         # Cyan
+    '[0;37m': '[white]',        # White
+    '[1;30m': '[bold black]',   # Bold Black
+    '[1;31m': '[bold red]',     # Bold Red
+    '[1;32m': '[bold green]',   # Bold Green
+    '[1;33m': '[bold yellow]',  # Bold Yellow
+    '[1;34m': '[bold blue]',    # Bold Blue
+    '[1;35m': '[bold magenta]',  # Bold Magenta
+    '[1;36m': '[bold cyan]',    # Bold Cyan
+    '[1;37m': '[bold white]',   # Bold White
+    '[0m': '[/]',               # Reset
+    '[1m': '[bold]',
+    '[22m': '[/bold]',
+}
+
 
 class ShellCommandProcess:
     """
@@ -46,11 +89,23 @@ class ShellCommandProcess:
             Process return code
         """
         try:
-            self.process = await asyncio.create_subprocess_shell(
-                self.config.command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+            if isinstance(self.config.command, list):
+                # Argv form: exec the program directly, no shell in between
+                self.process = await asyncio.create_subprocess_exec(
+                    *self.config.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=self.config.env,
+                    cwd=self.config.cwd
+                )
+            else:
+                self.process = await asyncio.create_subprocess_shell(
+                    self.config.command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=self.config.env,
+                    cwd=self.config.cwd
+                )
             self.running = True
             ShellCommandProcess._instances.add(self)
             
@@ -85,36 +140,11 @@ class ShellCommandProcess:
         Returns:
             Text with Rich markup tags
         """
-        ansi_to_rich = {
-            '[0;30m': '[black]',        # Black
-            '[0;31m': '[red]',          # Red
-            '[0;32m': '[green]',        # Green
-            '[0;33m': '[yellow]',       # Yellow
-            '[0;34m': '[blue]',         # Blue
-            '[0;35m': '[magenta]',      # Magenta
-            '[0;36m': '[cyan]',         # Cyan
-            '[0;37m': '[white]',        # White
-            '[1;30m': '[bold black]',   # Bold Black
-            '[1;31m': '[bold red]',     # Bold Red
-            '[1;32m': '[bold green]',   # Bold Green
-            '[1;33m': '[bold yellow]',  # Bold Yellow
-            '[1;34m': '[bold blue]',    # Bold Blue
-            '[1;35m': '[bold magenta]',  # Bold Magenta
-            '[1;36m': '[bold cyan]',    # Bold Cyan
-            '[1;37m': '[bold white]',   # Bold White
-            '[0m': '[/]',               # Reset
-            '[1m': '[bold]',
-            '[22m': '[/bold]',
-        }
-        
         result = text
-        for ansi_code, rich_markup in ansi_to_rich.items():
+        for ansi_code, rich_markup in _ANSI_TO_RICH.items():
             result = result.replace(ansi_code, rich_markup)
-        
-        ansi_pattern = re.compile(r'\x1b\[[0-9;]*[mK]')
-        result = ansi_pattern.sub('', result)
-        
-        return result
+
+        return _ANSI_RE.sub('', result)
 
     async def _read_stream(self, stream, output_list) -> None:
         """
@@ -201,29 +231,16 @@ class ShellCommandProcess:
         Returns:
             Tuple of (error_found: bool, error_line: str or None)
         """
-        error_patterns = [
-            r"could not open port",
-            r"No such file or directory",
-            r"Permission denied",
-            r"Device or resource busy",
-            r"Connection refused",
-            r"Error:",
-            r"Failed:",
-            r"Exception:",
-            r"Traceback",
-            r"\[Errno \d+\]",  # System error codes
-            r"command not found",
-            r"bash:.*: No such file or directory"
-        ]
-        
-        all_output = self.stdout_lines + self.stderr_lines
-        
-        for line in all_output:
-            for pattern in error_patterns:
-                if re.search(pattern, line, re.IGNORECASE):
-                    self.logger.error(f"Error in output line: '{line}' was found with pattern: '{pattern}'")
-                    return True, line
-                    
+        search = _ERROR_RE.search
+        for line in self.stdout_lines:
+            if search(line):
+                self.logger.error(f"Error in output line: '{line}'")
+                return True, line
+        for line in self.stderr_lines:
+            if search(line):
+                self.logger.error(f"Error in output line: '{line}'")
+                return True, line
+
         return False, None
 
     @classmethod
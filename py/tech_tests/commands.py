@@ -6,9 +6,10 @@ __description__ = '''
 Module for running shell commands and capturing their output in real-time.
 @deprecated: Use py.shell_commands.ShellCommandConfig instead.
 '''
+import os
+import selectors
 import subprocess
 import time
-import select
 from dataclasses import dataclass
 from py.log.rich_log_handler import LogSource, RichLogHandler
 
@@ -32,25 +33,37 @@ class ShellCommandRunner:
 
     def run_commands(self, command_obj_list: [ShellCommand], show_stderr: bool = True) -> int:
         """
-        Run a shell command and display its output in real-time.
-        
+        Run a chain of shell commands, stopping at the first failure.
+
         Args:
             command_obj_list: List of Command to execute in shell
-            logger: Logger instance for additional logging
-            
+            show_stderr: Whether stderr lines are logged
+
         Returns:
-            int: Exit code of the executed command
+            int: Exit code of the last executed command
         """
+        for i, command_obj in enumerate(command_obj_list):
+            if i:
+                time.sleep(0.3)  # Optional delay before running the next command
+            returncode = self._run_command(command_obj, show_stderr)
+            if returncode != 0:
+                return returncode
+
+        command_logger = RichLogHandler.get_logger(LogSource.PYTHON, "SHELL")
+        command_logger.info("All commands executed successfully.")
+        return 0
+
+    def _run_command(self, command_obj: ShellCommand, show_stderr: bool = True) -> int:
+        """
+        Run a single shell command and display its output in real-time.
 
-        if not command_obj_list:
-            command_logger = RichLogHandler.get_logger(LogSource.PYTHON, "SHELL")
-            command_logger.info("All commands executed successfully.")
-            return 0
-        # Get the first command object from the list
-        command_obj = command_obj_list[0]
-
-
+        Args:
+            command_obj: Command to execute in shell
+            show_stderr: Whether stderr lines are logged
 
+        Returns:
+            int: Exit code of the executed command
+        """
         command_obj.logger.info(f"Running command: {command_obj.name} ({command_obj.command})")
         process = subprocess.Popen(
             command_obj.command,
@@ -61,36 +74,50 @@ class ShellCommandRunner:
             bufsize=0    # Disable buffering
         )
 
-        # Main loop runs until the process completes
-        while process.poll() is None:
-            # Wait for data from either stdout or stderr with timeout
-            readable, _, _ = select.select([process.stdout, process.stderr], [], [], 0.1)
-
-            # Process all available outputs
-            for stream in readable:
-                # Read all available data from the current stream
-                while True:
-                    line = stream.readline()
-                    if not line:  # No more data available
-                        break
-                    # Convert binary data to text
-                    text = line.decode('utf-8').strip()
-                    if stream == process.stdout:
-                        command_obj.logger.info(text)
-                    else:
-                        if show_stderr:
-                            command_obj.logger.error(text)
-            # Short pause to prevent CPU overload
-            time.sleep(0.01)
-
-        # Process has finished, read remaining output
-        for line in iter(process.stdout.readline, b''):
-            text = line.decode('utf-8').strip()
-            command_obj.logger.info(text)
-        if show_stderr:
-            for line in iter(process.stderr.readline, b''):
-                text = line.decode('utf-8').strip()
-                command_obj.logger.error(f'text')
+        # Stream both pipes through one selector (epoll on Linux), reading
+        # large chunks and emitting only complete lines from per-stream buffers.
+        # Logger methods are bound to locals once - on a verbose build log the
+        # per-line attribute lookups are measurable interpreter overhead.
+        stdout = process.stdout
+        log_info = command_obj.logger.info
+        log_error = command_obj.logger.error
+
+        def emit_lines(stream, text: str) -> None:
+            if stream is stdout:
+                for line in text.split('\n'):
+                    log_info(line.strip())
+            elif show_stderr:
+                for line in text.split('\n'):
+                    log_error(line.strip())
+
+        sel = selectors.DefaultSelector()
+        buffers = {}
+        for stream in (process.stdout, process.stderr):
+            os.set_blocking(stream.fileno(), False)
+            sel.register(stream, selectors.EVENT_READ)
+            buffers[stream] = bytearray()
+
+        # The selector blocks until data or EOF, so no polling sleep is needed
+        while buffers:
+            for key, _ in sel.select():
+                stream = key.fileobj
+                chunk = os.read(stream.fileno(), 65536)
+                buffer = buffers[stream]
+                if not chunk:  # EOF - flush any unterminated tail line
+                    sel.unregister(stream)
+                    if buffer:
+                        emit_lines(stream, bytes(buffer).decode('utf-8', 'replace'))
+                    del buffers[stream]
+                    continue
+                buffer += chunk
+                # Decode all complete lines of the chunk in one go instead of
+                # one decode call per line; the unterminated tail stays buffered
+                cut = buffer.rfind(b'\n')
+                if cut >= 0:
+                    complete = bytes(buffer[:cut]).decode('utf-8', 'replace')
+                    del buffer[:cut + 1]
+                    emit_lines(stream, complete)
+        sel.close()
 
         # Close the streams
         process.stdout.close()
@@ -103,10 +130,5 @@ class ShellCommandRunner:
         else:
             command_obj.logger.info(f"\n✅ Command '{command_obj.name}' completed successfully with exit code {process.returncode}\n")
 
-        # If there is a next command, run it recursively
-        if (process.returncode==0) :
-            time.sleep(0.3)  # Optional delay before running the next command
-            return self.run_commands(command_obj_list[1:], show_stderr)
-
         return process.returncode
 
@@ -1,10 +1,15 @@
 # minimal_tabs_encapsulated_with_button.py
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.widgets import Footer, TabbedContent, TabPane, Static, RichLog, Button
 from textual.containers import Vertical, Container
 
+# Pre-segmented once; passing a Text instead of a str lets RichLog skip
+# the markup parse on every press
+_LINE = Text("Button pressed – new log entry")
+
 
 class OverviewPanel(Vertical):
     """Simple panel with static text content."""
@@ -17,15 +22,15 @@ class OverviewPanel(Vertical):
 class LogsPanel(Container):
     """Panel with RichLog and a button to append messages."""
     def compose(self) -> ComposeResult:
-        # RichLog and a button stacked vertically
-        yield RichLog(id="log")
+        # RichLog and a button stacked vertically; keep the log reference
+        # so the button handler does not re-query the DOM on every press
+        self._log = RichLog(id="log")
+        yield self._log
         yield Button("Add line", id="add-btn")
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Append a line to the RichLog when the button is pressed."""
-        # Find our RichLog by ID and write a message
-        log: RichLog = self.query_one("#log", RichLog)
-        log.write("Button pressed – new log entry")
+        self._log.write(_LINE)
 
 
 class DemoApp(App):